@@ -7,35 +7,113 @@ and structure it for storage in the vector database.
 
 import json
 import re
-from pydantic import BaseModel, Field
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 from datapizza.agents import Agent  # type: ignore
 
-from ..config import create_client
+from ..config import create_client, settings
+from ..database.extraction_cache import ExtractionCache
+from ..models.extracted_recipe import (
+    BatchRecipeList,
+    ExtractedRecipe,
+    RecipeList,
+)
 
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\[[\s\S]*?\])\s*```", re.IGNORECASE)
+_JSON_OPENER_RE = re.compile(r"[\[{]")
+_JSON_DECODER = json.JSONDecoder()
 
-class ExtractedRecipe(BaseModel):
-    """Pydantic model for extracted recipe data."""
 
-    name: str
-    description: str
-    category: str = Field(
-        description="One of: appetizer, main_dish, second_plate, dessert"
+def _decode_first_json_value(
+    text: str, skip: set[int] | None = None
+) -> list | dict | None:
+    """
+    Decode the first complete JSON array or object in the text.
+
+    Array and object openers are located in one regex pass, in document order,
+    and the C decoder stops at the matching closing bracket, so the text is
+    never rescanned per bracket type or sliced into candidate substrings.
+    """
+    for match in _JSON_OPENER_RE.finditer(text):
+        idx = match.start()
+        if skip and idx in skip:
+            continue
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, idx)
+            return value
+        except json.JSONDecodeError:
+            pass
+    return None
+
+
+def _as_recipe_list(value: list | dict) -> list:
+    """Unwrap a decoded JSON value into a list of recipes (or a {"recipes": [...]})."""
+    if isinstance(value, dict):
+        recipes = value.get("recipes")
+        return recipes if isinstance(recipes, list) else [value]
+    return value
+
+
+def _iter_json_array_items(chunks: Iterable[str]) -> Iterator[dict]:
+    """
+    Incrementally yield the objects of the first JSON array in a text stream.
+
+    Each object is emitted as soon as its closing brace arrives, so callers can
+    start working before the whole array has been received. Leading prose or a
+    markdown fence before the array is skipped.
+    """
+    buffer = ""
+    pos = -1
+    for chunk in chunks:
+        buffer += chunk
+        if pos == -1:
+            pos = buffer.find("[")
+            if pos == -1:
+                continue
+            pos += 1
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                value, pos = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            if isinstance(value, dict):
+                yield value
+
+
+_RECIPES_ADAPTER = TypeAdapter(list[ExtractedRecipe])
+_RECIPE_FIELDS = tuple(ExtractedRecipe.model_fields)
+
+
+def _recipe_key(recipe: dict) -> tuple:
+    """Content key identifying the same recipe across extractions."""
+    return (
+        str(recipe.get("name", "")).strip().lower(),
+        tuple(sorted(str(i).strip().lower() for i in recipe.get("ingredients") or ())),
     )
-    ingredients: list[str] = Field(default_factory=list)
-    instructions: list[str] = Field(default_factory=list)
-    servings: int = Field(default=4)
-    prep_time_minutes: int | None = None
-    cook_time_minutes: int | None = None
-    dietary_tags: list[str] = Field(default_factory=list)
-    allergens: list[str] = Field(default_factory=list)
-    difficulty: str = Field(default="medium", description="One of: easy, medium, hard")
-    is_christmas_traditional: bool = Field(default=True)
 
 
-class RecipeList(BaseModel):
-    """Wrapper model for a list of recipes."""
+def _dedupe_recipes(recipes: list[dict]) -> list[dict]:
+    """Keep the first occurrence of each recipe so duplicates are not stored twice."""
+    seen: set[tuple] = set()
+    unique = []
+    for recipe in recipes:
+        key = _recipe_key(recipe)
+        if key not in seen:
+            seen.add(key)
+            unique.append(recipe)
 
-    recipes: list[ExtractedRecipe]
+    if len(unique) < len(recipes):
+        logger.debug(f"Dropped {len(recipes) - len(unique)} duplicate recipe(s)")
+    return unique
 
 
 class DocumentParsingAgent(Agent):
@@ -46,24 +124,35 @@ class DocumentParsingAgent(Agent):
 
     SYSTEM_PROMPT = """You are an expert at extracting recipe information from text.
 Your task is to analyze text from PDF documents and extract structured recipe information.
+Extract every recipe found in the TEXT you are given.
 
-For each recipe you find, extract:
-- Recipe name
-- Description
-- Category (appetizer, main_dish, second_plate, or dessert)
-- Ingredients list
-- Instructions
-- Estimated servings
-- Estimated prep time and cook time (if mentioned)
-- Dietary tags (vegan, vegetarian, gluten_free, dairy_free, nut_free)
-- Allergens
-- Difficulty level (easy, medium, hard)
-- Whether it's a traditional Christmas recipe
-
-Return the information as a JSON array of recipe objects."""
+Return a JSON array of recipe objects. Each recipe should have:
+- name: string
+- description: string
+- category: one of "appetizer", "main_dish", "second_plate", "dessert"
+- ingredients: array of strings
+- instructions: array of strings
+- servings: integer (default to 4 if not specified)
+- prep_time_minutes: integer or null
+- cook_time_minutes: integer or null
+- dietary_tags: array of strings (e.g., ["vegetarian", "vegan"])
+- allergens: array of strings
+- difficulty: "easy", "medium", or "hard"
+- is_christmas_traditional: boolean"""
+
+    BATCH_TOKEN_BUDGET = 12000
+    # ExtractedRecipe has only plain fields (no aliases, serializers or computed
+    # fields), so a field copy matches model_dump; set False if that changes
+    FAST_DUMP = True
+    CHARS_PER_TOKEN = 4
 
     def __init__(
-        self, api_key: str | None = None, provider: str | None = None, **kwargs
+        self,
+        api_key: str | None = None,
+        provider: str | None = None,
+        use_cache: bool | None = None,
+        cache: ExtractionCache | None = None,
+        **kwargs,
     ):
         """
         Initialize the document parsing agent.
@@ -71,6 +160,8 @@ Return the information as a JSON array of recipe objects."""
         Args:
             api_key: OpenAI API key (not needed for Ollama)
             provider: LLM provider override ("openai" or "ollama")
+            use_cache: Whether to reuse previous extractions for identical documents. Uses settings default if None.
+            cache: Custom extraction cache instance (useful for testing)
         """
         client = create_client(
             api_key=api_key,
@@ -89,10 +180,37 @@ Return the information as a JSON array of recipe objects."""
             **kwargs,
         )
 
+        self._use_structured = callable(
+            getattr(self._client, "structured_response", None)
+        )
+
+        self._cache = cache
+        if self._cache is None and (
+            settings.EXTRACTION_CACHE_ENABLED if use_cache is None else use_cache
+        ):
+            embedder = None
+            if settings.EXTRACTION_CACHE_SEMANTIC:
+                from datapizza.embedders.openai import OpenAIEmbedder  # type: ignore
+
+                embedder = OpenAIEmbedder(
+                    api_key=api_key or settings.OPENAI_API_KEY,
+                    model_name=settings.EMBEDDING_MODEL,
+                )
+            self._cache = ExtractionCache(
+                namespace=self.SYSTEM_PROMPT, embedder=embedder
+            )
+
+    def _dump_recipes(self, recipes: list[ExtractedRecipe]) -> list[dict]:
+        """Convert validated recipes to dictionaries."""
+        if self.FAST_DUMP:
+            return [{f: getattr(r, f) for f in _RECIPE_FIELDS} for r in recipes]
+        return _RECIPES_ADAPTER.dump_python(recipes)
+
     def extract_recipes(self, text: str) -> list[dict]:
         """
         Extract recipe information from text using AI.
-        Uses structured response when possible, falls back to JSON extraction.
+        Previously parsed (or, with semantic caching, near-identical) documents
+        are served from the extraction cache without calling the LLM.
 
         Args:
             text: Text content from PDF document
@@ -100,51 +218,246 @@ Return the information as a JSON array of recipe objects."""
         Returns:
             List of recipe dictionaries with extracted information
         """
-        prompt = f"""Extract all recipe information from the following text.
-Return a JSON array of recipe objects. Each recipe should have:
-- name: string
-- description: string
-- category: one of "appetizer", "main_dish", "second_plate", "dessert"
-- ingredients: array of strings
-- instructions: array of strings
-- servings: integer (default to 4 if not specified)
-- prep_time_minutes: integer or null
-- cook_time_minutes: integer or null
-- dietary_tags: array of strings (e.g., ["vegetarian", "vegan"])
-- allergens: array of strings
-- difficulty: "easy", "medium", or "hard"
-- is_christmas_traditional: boolean
+        if self._cache is not None:
+            cached = self._cache.get(text)
+            if cached is not None:
+                return cached
 
-Text to analyze:
-{text}
-"""
+        recipes = _dedupe_recipes(self._extract_recipes_uncached(text))
+
+        if self._cache is not None and recipes:
+            self._cache.set(text, recipes)
+
+        return recipes
+
+    def _extract_recipes_uncached(self, text: str) -> list[dict]:
+        """
+        Extract recipes with the LLM.
+        Uses structured response when possible, falls back to JSON extraction.
+
+        Args:
+            text: Text content from PDF document
+
+        Returns:
+            List of recipe dictionaries with extracted information
+        """
+        prompt = self._build_extraction_prompt(text)
 
         try:
-            if hasattr(self.client, "structured_response"):
+            if self._use_structured:
                 try:
-                    response = self.client.structured_response(
+                    response = self._client.structured_response(
                         input=prompt, output_cls=RecipeList
                     )
                     if response.structured_data and len(response.structured_data) > 0:
                         recipe_list = response.structured_data[0]
-                        return [recipe.model_dump() for recipe in recipe_list.recipes]
+                        return self._dump_recipes(recipe_list.recipes)
                 except Exception as e:
                     print(
                         f"Structured response failed, falling back to JSON extraction: {e}"
                     )
 
-            response = self.invoke(prompt)
-            response_text = (
-                response.text if hasattr(response, "text") else str(response)
-            )
-
-            recipes = self._extract_json_from_response(response_text)
-            return recipes
+            return list(self._stream_recipes(prompt))
 
         except Exception as e:
             print(f"Error extracting recipes: {e}")
             return []
 
+    def _build_extraction_prompt(self, text: str) -> str:
+        """
+        Build the single-document extraction prompt.
+        The schema lives in SYSTEM_PROMPT so the request prefix stays identical
+        across calls and can be served from the provider's prompt cache.
+        """
+        return f"TEXT:\n{text}"
+
+    def extract_recipes_iter(self, text: str) -> Iterator[dict]:
+        """
+        Extract recipe information from text, yielding each recipe as soon as it is parsed.
+        Streams the LLM response instead of waiting for the full answer, so downstream
+        work (e.g. vector store upserts) can start before the model has finished.
+
+        Args:
+            text: Text content from PDF document
+
+        Yields:
+            Recipe dictionaries with extracted information
+        """
+        if self._cache is not None:
+            cached = self._cache.get(text)
+            if cached is not None:
+                yield from cached
+                return
+
+        recipes = []
+        seen: set[tuple] = set()
+        try:
+            for recipe in self._stream_recipes(self._build_extraction_prompt(text)):
+                key = _recipe_key(recipe)
+                if key in seen:
+                    continue
+                seen.add(key)
+                recipes.append(recipe)
+                yield recipe
+        except Exception as e:
+            print(f"Error streaming recipes: {e}")
+            return
+
+        if self._cache is not None and recipes:
+            self._cache.set(text, recipes)
+
+    def _stream_recipes(self, prompt: str) -> Iterator[dict]:
+        """
+        Stream the LLM response for a prompt and parse recipes incrementally.
+
+        Args:
+            prompt: Extraction prompt to send to the model
+
+        Yields:
+            Validated recipe dictionaries
+        """
+        received: list[str] = []
+
+        def deltas() -> Iterator[str]:
+            for response in self._client.stream_invoke(prompt):
+                if response.delta:
+                    received.append(response.delta)
+                    yield response.delta
+
+        found = False
+        for item in _iter_json_array_items(deltas()):
+            try:
+                validated = ExtractedRecipe.model_validate(item)
+                recipe = self._dump_recipes([validated])[0]
+            except ValidationError as e:
+                print(f"Skipping invalid recipe in stream: {e}")
+                continue
+            found = True
+            yield recipe
+
+        if not found:
+            # No array in the stream (e.g. a single bare object): parse the full text
+            yield from self._extract_json_from_response("".join(received))
+
+    def extract_recipes_many(
+        self, texts: list[str], max_inflight: int = 8
+    ) -> list[list[dict]]:
+        """
+        Extract recipes from several documents with concurrent LLM calls.
+        Unlike extract_recipes_batch, every document keeps its own request, so
+        one bad document cannot spoil the others.
+
+        Args:
+            texts: Text contents from PDF documents
+            max_inflight: Maximum number of concurrent LLM requests
+
+        Returns:
+            One list of recipe dictionaries per input text, in the same order
+        """
+        if len(texts) <= 1 or max_inflight <= 1:
+            return [self.extract_recipes(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=min(max_inflight, len(texts))) as pool:
+            return list(pool.map(self.extract_recipes, texts))
+
+    def extract_recipes_batch(self, texts: list[str]) -> list[list[dict]]:
+        """
+        Extract recipes from several documents, packing them into as few LLM calls as possible.
+        Documents are grouped until BATCH_TOKEN_BUDGET is reached; groups that fail
+        validation fall back to one extract_recipes call per document.
+
+        Args:
+            texts: Text contents from PDF documents
+
+        Returns:
+            One list of recipe dictionaries per input text, in the same order
+        """
+        results: list[list[dict]] = [[] for _ in texts]
+        pending: list[int] = []
+        for i, text in enumerate(texts):
+            cached = self._cache.get(text) if self._cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        for group in self._pack_batches([texts[i] for i in pending]):
+            indices = [pending[j] for j in group]
+            if len(indices) == 1:
+                results[indices[0]] = self.extract_recipes(texts[indices[0]])
+                continue
+
+            batch = self._extract_batch_uncached([texts[i] for i in indices])
+            if batch is None:
+                for i in indices:
+                    results[i] = self.extract_recipes(texts[i])
+                continue
+
+            for i, recipes in zip(indices, batch):
+                results[i] = recipes
+                if self._cache is not None and recipes:
+                    self._cache.set(texts[i], recipes)
+
+        return results
+
+    def _pack_batches(self, texts: list[str]) -> list[list[int]]:
+        """Group text indices so each group stays within the token budget."""
+        groups: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = len(text) // self.CHARS_PER_TOKEN + 1
+            if current and current_tokens + tokens > self.BATCH_TOKEN_BUDGET:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def _extract_batch_uncached(self, texts: list[str]) -> list[list[dict]] | None:
+        """
+        Extract recipes from a group of documents with a single structured LLM call.
+
+        Args:
+            texts: Text contents from PDF documents
+
+        Returns:
+            One list of recipe dictionaries per text, or None if the response is unusable
+        """
+        if not self._use_structured:
+            return None
+
+        documents = "\n\n".join(
+            f"<<<DOC {i}>>>\n{text}\n<<<END {i}>>>" for i, text in enumerate(texts)
+        )
+        prompt = f"""Extract all recipe information from each of the {len(texts)} documents below.
+Each document is delimited by <<<DOC i>>> and <<<END i>>>.
+Return one entry per document with its doc_index (i) and the recipes found in it
+(an empty list if the document contains no recipes). Never mix recipes between documents.
+
+{documents}
+"""
+        try:
+            response = self._client.structured_response(
+                input=prompt, output_cls=BatchRecipeList
+            )
+            batch = response.structured_data[0]
+        except Exception as e:
+            print(f"Batch extraction failed, falling back to single documents: {e}")
+            return None
+
+        by_index = {doc.doc_index: doc for doc in batch.documents}
+        if set(by_index) != set(range(len(texts))):
+            print("Batch extraction returned mismatched documents, falling back")
+            return None
+
+        return [
+            _dedupe_recipes(self._dump_recipes(by_index[i].recipes))
+            for i in range(len(texts))
+        ]
+
     def _extract_json_from_response(self, response_text: str) -> list[dict]:
         """
         Extract JSON from agent response, handling various formats:
@@ -158,35 +471,18 @@ Text to analyze:
         Returns:
             List of recipe dictionaries
         """
-        json_block_pattern = r"```(?:json)?\s*(\[[\s\S]*?\])\s*```"
-        match = re.search(json_block_pattern, response_text, re.IGNORECASE)
-        if match:
-            try:
-                recipes = json.loads(match.group(1))
-                return recipes if isinstance(recipes, list) else [recipes]
-            except json.JSONDecodeError:
-                pass
-
-        json_start = response_text.find("[")
-        json_end = response_text.rfind("]") + 1
+        failed_starts: set[int] = set()
 
-        if json_start != -1 and json_end > json_start:
+        match = _JSON_BLOCK_RE.search(response_text)
+        if match:
             try:
-                json_str = response_text[json_start:json_end]
-                recipes = json.loads(json_str)
-                return recipes if isinstance(recipes, list) else [recipes]
+                return _as_recipe_list(json.loads(match.group(1)))
             except json.JSONDecodeError:
-                pass
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
+                failed_starts.add(match.start(1))
 
-        if json_start != -1 and json_end > json_start:
-            try:
-                json_str = response_text[json_start:json_end]
-                recipe = json.loads(json_str)
-                return [recipe] if isinstance(recipe, dict) else []
-            except json.JSONDecodeError:
-                pass
+        value = _decode_first_json_value(response_text, failed_starts)
+        if isinstance(value, (list, dict)):
+            return _as_recipe_list(value)
 
         print(
             f"Warning: Could not extract JSON from agent response: {response_text[:200]}"
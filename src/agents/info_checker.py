@@ -9,15 +9,144 @@ Using datapizza-ai features:
 Supports both OpenAI and Ollama providers.
 """
 
+import hashlib
 import json
+import re
+from collections import deque
 from datapizza.agents import Agent  # type: ignore
 from datapizza.memory import Memory  # type: ignore
+from datapizza.memory.memory import Turn  # type: ignore
 from datapizza.tools import tool  # type: ignore
 from datapizza.type import ROLE, TextBlock  # type: ignore
 
 from ..config import create_client
 from ..models.user_preferences import UserPreferences, Allergy
 
+_ALLERGY_BY_VALUE = {a.value: a for a in Allergy}
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+_PIPE_SPLIT = re.compile(r"\s*\|\s*")
+# Keywords hinting that a message answers a question-table topic; one named
+# group per topic so a single scan reports every topic that was mentioned
+_TOPIC_PATTERNS = {
+    "number_of_guests": r"\d|\b(?:one|two|three|four|five|six|seven|eight|nine|ten"
+    r"|eleven|twelve|dozen|couple|guest|people|person|famil|friend|adult|kid|child)",
+    "dietary_restrictions": r"\b(?:vegan|vegetarian|diet|halal|kosher)",
+    "allergies": r"\b(?:allerg|intoleran|celiac|coeliac|lactose|"
+    + "|".join(a.value.rstrip("s") for a in Allergy)
+    + r")",
+}
+_TOPIC_RE = re.compile(
+    "|".join(f"(?P<{topic}>{pattern})" for topic, pattern in _TOPIC_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+
+def _mentioned_topics(message: str) -> set[str]:
+    """Return the question-table topics a message touches, in one regex pass."""
+    return {match.lastgroup for match in _TOPIC_RE.finditer(message)}
+
+
+# field -> (preference keys that answer it, question); with no keys the field is
+# only asked about when listed in missing_fields
+_QUESTION_TABLE: dict[str, tuple[tuple[str, ...], str]] = {
+    "number_of_guests": (
+        (),
+        "How many guests are you expecting for Christmas dinner?",
+    ),
+    "dietary_restrictions": (
+        ("has_vegetarians", "has_vegans"),
+        "Are there any vegetarian or vegan guests?",
+    ),
+    "allergies": (
+        ("allergies",),
+        "Does anyone have food allergies I should be aware of?",
+    ),
+}
+_TRIVIAL_MISSING_INFO = list(_QUESTION_TABLE)
+
+
+def _needs(
+    field: str,
+    pref_keys: tuple[str, ...],
+    preferences: dict | None,
+    missing_fields: list,
+) -> bool:
+    """Check whether a question-table entry still has to be asked."""
+    if pref_keys:
+        preferences = preferences or {}
+        return not any(preferences.get(key) for key in pref_keys)
+    return field in missing_fields
+
+
+# Compact separators: tool results go back to the LLM, so whitespace costs tokens
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class BoundedMemory(Memory):
+    """
+    Conversation memory capped to the most recent `max_turns` turns.
+
+    Evicted user turns are folded into a single rolling summary turn kept at the
+    front, so facts like the guest count survive while the prompt re-sent on
+    every run stays bounded instead of growing with the whole conversation.
+    """
+
+    SUMMARY_HEADER = "Summary of earlier messages from the user:"
+    MAX_SUMMARY_CHARS = 200
+
+    def __init__(self, max_turns: int = 8):
+        super().__init__()
+        self.max_turns = max_turns
+        self._summary_lines: list[str] = []
+        self._last_exchange: str | None = None
+
+    def add_turn(self, blocks, role: ROLE):
+        """Add a turn, folding the oldest ones into the summary when over budget."""
+        super().add_turn(blocks, role)
+
+        offset = 1 if self._summary_lines else 0
+        overflow = len(self.memory) - offset - self.max_turns
+        if overflow <= 0:
+            return
+
+        evicted = self.memory[offset : offset + overflow]
+        del self.memory[: offset + overflow]
+        for turn in evicted:
+            if turn.role != ROLE.USER:
+                continue
+            for block in turn:
+                if isinstance(block, TextBlock) and block.content:
+                    self._summary_lines.append(
+                        f"- {block.content[: self.MAX_SUMMARY_CHARS]}"
+                    )
+        del self._summary_lines[: -self.max_turns]
+
+        if self._summary_lines:
+            summary = "\n".join([self.SUMMARY_HEADER, *self._summary_lines])
+            self.memory.insert(0, Turn([TextBlock(content=summary)], ROLE.USER))
+
+    def add_exchange(self, user_text: str, assistant_text: str) -> bool:
+        """
+        Record a user/assistant exchange, skipping exact repeats of the last one.
+
+        Returns:
+            True if the exchange was added, False if it was a duplicate
+        """
+        digest = hashlib.sha256(f"{user_text}\0{assistant_text}".encode()).hexdigest()
+        if digest == self._last_exchange:
+            return False
+
+        self._last_exchange = digest
+        self.add_turn(TextBlock(content=user_text), role=ROLE.USER)
+        self.add_turn(TextBlock(content=assistant_text), role=ROLE.ASSISTANT)
+        return True
+
+    def clear(self):
+        """Clear all turns and the rolling summary."""
+        super().clear()
+        self._summary_lines = []
+        self._last_exchange = None
+
 
 # Stateless tools for the Info Checker Agent
 
@@ -42,14 +171,14 @@ def validate_preferences(preferences_json: str) -> str:
             data["custom_allergies"] = []
         preferences = UserPreferences.model_validate(data)
     except Exception as e:
-        return json.dumps(
+        return _dumps(
             {
                 "valid": False,
                 "error": str(e),
                 "message": "Failed to validate preferences",
             }
         )
-    return json.dumps(
+    return _dumps(
         {
             "valid": True,
             "preferences": preferences.model_dump(),
@@ -94,12 +223,11 @@ def create_preferences_object(
     custom_allergies = []
 
     if allergies:
-        for allergy in allergies.split(","):
-            allergy = allergy.strip().lower()
-            try:
-                allergy_list.append(Allergy(allergy))
-            except ValueError:
-                custom_allergies.append(allergy)
+        for allergy in _COMMA_SPLIT.split(allergies.strip().lower()):
+            if not allergy:
+                continue
+            hit = _ALLERGY_BY_VALUE.get(allergy)
+            (allergy_list if hit else custom_allergies).append(hit or allergy)
 
     preferences = UserPreferences(
         number_of_guests=number_of_guests,
@@ -116,7 +244,7 @@ def create_preferences_object(
         additional_notes=additional_notes if additional_notes else None,
     )
 
-    return json.dumps(
+    return _dumps(
         {
             "preferences": preferences.model_dump(),
             "summary": preferences.get_dietary_requirements_summary(),
@@ -172,12 +300,14 @@ def _create_finalize_extraction_tool(result_holder: dict):
             "is_complete": is_complete,
             "response_text": response_text,
             "preferences": preferences,
-            "missing_info": [m.strip() for m in missing_info.split(",") if m.strip()],
-            "questions": [q.strip() for q in questions.split("|") if q.strip()],
+            "missing_info": list(
+                filter(None, _COMMA_SPLIT.split(missing_info.strip()))
+            ),
+            "questions": list(filter(None, _PIPE_SPLIT.split(questions.strip()))),
             "summary": summary,
         }
 
-        return json.dumps({"status": "success", "result": result_holder["result"]})
+        return _dumps({"status": "success", "result": result_holder["result"]})
 
     return finalize_extraction
 
@@ -188,6 +318,7 @@ class InfoCheckerAgent(Agent):
     Ensures all necessary information is collected before menu planning.
 
     Uses Memory for conversation context retention, allowing iterative preference gathering across multiple interactions.
+    The memory is bounded (see BoundedMemory) so long conversations do not inflate every request.
     """
 
     SYSTEM_PROMPT = """You are an expert Christmas menu planning assistant. Your role is to gather all the information needed to plan the perfect Christmas menu.
@@ -227,9 +358,11 @@ You need to collect the following information from the user:
 
 ## WORKFLOW
 
-1. Use create_preferences_object to structure the information you have (use defaults for unknown fields)
-2. Use validate_preferences to check completeness
-3. ALWAYS call finalize_extraction at the end:
+For every user message:
+1. Extract all information the user provided (guests, dietary needs, allergies, preferences) and combine it with what you already know from previous messages in the conversation
+2. Use create_preferences_object to structure the information you have (use defaults for unknown fields)
+3. Use validate_preferences to check completeness
+4. ALWAYS call finalize_extraction at the end:
    - is_complete=True only if you have: number_of_guests AND confirmed dietary restrictions/allergies
    - is_complete=False if any essential info is missing
    - response_text: Your friendly message to the user (MUST include follow-up questions if info is missing!)
@@ -250,6 +383,8 @@ You should:
 CRITICAL: You MUST call finalize_extraction at the end with response_text containing your friendly message to the user!"""
 
     name = "info_checker"
+    MAX_MEMORY_TURNS = 8
+    RECENT_TURNS = 16
 
     def __init__(self, api_key: str | None = None, provider: str | None = None):
         """
@@ -266,7 +401,8 @@ CRITICAL: You MUST call finalize_extraction at the end with response_text contai
             provider=provider,
         )
 
-        self._conversation_memory = Memory()
+        self._conversation_memory = BoundedMemory(max_turns=self.MAX_MEMORY_TURNS)
+        self._recent_turns: deque[dict] = deque(maxlen=self.RECENT_TURNS)
         self._extraction_result_holder: dict = {"result": None}
         self._finalize_extraction_tool = _create_finalize_extraction_tool(
             self._extraction_result_holder
@@ -307,12 +443,7 @@ CRITICAL: You MUST call finalize_extraction at the end with response_text contai
             extraction_result.get("response_text", "") if extraction_result else ""
         )
 
-        self._conversation_memory.add_turn(
-            TextBlock(content=user_message), role=ROLE.USER
-        )
-        self._conversation_memory.add_turn(
-            TextBlock(content=response_text), role=ROLE.ASSISTANT
-        )
+        self._remember(user_message, response_text)
 
         if extraction_result:
             return {
@@ -330,6 +461,17 @@ CRITICAL: You MUST call finalize_extraction at the end with response_text contai
             "summary": "",
         }
 
+    def _remember(self, user_message: str, response_text: str) -> None:
+        """Record an exchange in memory and in the recent-turns window."""
+        if self._conversation_memory.add_exchange(user_message, response_text):
+            self._recent_turns.extend(
+                {"role": role.value, "blocks": [{"type": "text", "content": text}]}
+                for role, text in (
+                    (ROLE.USER, user_message),
+                    (ROLE.ASSISTANT, response_text),
+                )
+            )
+
     def extract_preferences(self, user_message: str) -> dict:
         """
         Extract and validate user preferences from their message.
@@ -346,49 +488,65 @@ CRITICAL: You MUST call finalize_extraction at the end with response_text contai
                 - questions: Follow-up questions to ask (if incomplete)
                 - summary: Human-readable summary
         """
-        prompt = f"""
-Analyze the following user message and extract preferences for their Christmas menu.
-
-User message: "{user_message}"
-
-Steps:
-1. Extract all information the user provided (guests, dietary needs, allergies, preferences)
-2. Combine with any information from previous messages in our conversation
-3. Use create_preferences_object with the extracted information
-4. Use validate_preferences to check completeness
-5. Call finalize_extraction with:
-   - is_complete=True ONLY if you have number_of_guests AND confirmed dietary/allergy info
-   - Include questions for any missing information
-6. In your response, if information is missing, ASK the user friendly follow-up questions!
-
-Remember: You need at minimum the number of guests, and should confirm dietary restrictions and allergies.
-"""
+        trivial = self._trivial_extraction(user_message)
+        if trivial is not None:
+            return trivial
+
+        prompt = f'User message: "{user_message}"'
         return self._run_extraction(prompt, user_message)
 
-    def ask_missing_info(self, current_preferences: dict, missing_fields: list) -> str:
+    def _trivial_extraction(self, user_message: str) -> dict | None:
+        """
+        Answer opening messages that carry no usable information without the LLM.
+
+        A first message like "hi" or "I need a Christmas menu" always ends with the
+        same follow-up questions, so the full tool loop is skipped for it.
+
+        Args:
+            user_message: The user's message
+
+        Returns:
+            The canned extraction result, or None if the LLM is needed
+        """
+        if self._conversation_memory or _mentioned_topics(user_message):
+            return None
+
+        questions = self.ask_missing_info({}, _TRIVIAL_MISSING_INFO).split("\n")
+        response_text = (
+            "I'd be happy to help plan your Christmas menu! To get started, could you tell me:\n"
+            + "\n".join(f"{i}. {q}" for i, q in enumerate(questions, start=1))
+        )
+        self._remember(user_message, response_text)
+
+        return {
+            "raw_response": response_text,
+            "is_complete": False,
+            "response_text": response_text,
+            "preferences": {},
+            "missing_info": list(_TRIVIAL_MISSING_INFO),
+            "questions": questions,
+            "summary": "",
+        }
+
+    def ask_missing_info(
+        self, current_preferences: dict | None, missing_fields: list
+    ) -> str:
         """
         Generate questions to ask the user for missing information.
         Uses Memory context to avoid asking for already-provided information.
 
         Args:
-            current_preferences: Currently known preferences
+            current_preferences: Currently known preferences (None if none yet)
             missing_fields: List of fields that are missing
 
         Returns:
             String with friendly questions to ask the user
         """
-        questions = []
-
-        if "number_of_guests" in missing_fields:
-            questions.append("How many guests are you expecting for Christmas dinner?")
-
-        if not current_preferences.get(
-            "has_vegetarians"
-        ) and not current_preferences.get("has_vegans"):
-            questions.append("Are there any vegetarian or vegan guests?")
-
-        if not current_preferences.get("allergies"):
-            questions.append("Does anyone have food allergies I should be aware of?")
+        questions = [
+            question
+            for field, (pref_keys, question) in _QUESTION_TABLE.items()
+            if _needs(field, pref_keys, current_preferences, missing_fields)
+        ]
 
         return (
             "\n".join(questions) if questions else "I have all the information I need!"
@@ -405,31 +563,20 @@ Remember: You need at minimum the number of guests, and should confirm dietary r
         Returns:
             Updated preferences dictionary
         """
-        prompt = f"""
-The user has provided additional information: "{additional_info}"
-
-Steps:
-1. Combine this new information with what we already know from our conversation
-2. Use create_preferences_object with all the combined information
-3. Use validate_preferences to check if we now have everything needed
-4. Call finalize_extraction with:
-   - is_complete=True ONLY if you have number_of_guests AND confirmed dietary/allergy info
-   - Include questions for any still-missing information
-5. In your response, if any information is still missing, ASK the user friendly follow-up questions!
-
-Remember: You need at minimum the number of guests, and should confirm dietary restrictions and allergies.
-"""
+        prompt = f'The user has provided additional information: "{additional_info}"'
         return self._run_extraction(prompt, additional_info)
 
+    @property
+    def has_context(self) -> bool:
+        """Whether earlier turns can influence the next extraction."""
+        return bool(self._conversation_memory)
+
     def clear_memory(self) -> None:
         """Clear the conversation memory for a fresh start."""
-        self._conversation_memory = Memory()
-        self.memory = self._conversation_memory
+        self._conversation_memory.clear()
+        self._recent_turns.clear()
         self._extraction_result_holder["result"] = None
 
     def get_memory_summary(self) -> str:
-        """Get a summary of the current conversation context."""
-        try:
-            return self._conversation_memory.json_dumps()
-        except Exception:
-            return "No memory content available"
+        """Get the most recent conversation turns (at most RECENT_TURNS) as JSON."""
+        return _dumps(list(self._recent_turns))
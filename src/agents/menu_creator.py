@@ -1,8 +1,104 @@
-from typing import Any, Generator
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
+from unicodedata import combining, east_asian_width
 from datapizza.agents import Agent  # type: ignore
 from datapizza.tools import tool  # type: ignore
 
 from ..config import create_client
+from ..models.user_preferences import as_allergy_list
+
+
+_RULE = "━" * 66
+_TOP = "╔" + "═" * 66 + "╗"
+_BOT = "╚" + "═" * 66 + "╝"
+_TITLE_WIDTH = 42
+_MARGIN = " " * 20
+
+
+def _display_width(text: str) -> int:
+    """Terminal columns taken by text: wide/fullwidth chars count 2, combining marks 0."""
+    return sum(
+        0 if combining(c) else 2 if east_asian_width(c) in "WF" else 1 for c in text
+    )
+
+
+def _center_title(title: str) -> str:
+    """Center the title in the banner by display width, not code points."""
+    pad = max(0, _TITLE_WIDTH - _display_width(title))
+    left = pad // 2
+    return f"{' ' * left}{title}{' ' * (pad - left)}"
+
+
+_SECTION = "\n" + _RULE + "\n{emoji} {heading}\n" + _RULE + "\n{body}\n"
+
+# Built once at import; format_final_menu only substitutes the fields and joins
+_BANNER = (
+    "\n"
+    + _TOP
+    + "\n║"
+    + _MARGIN
+    + "🎄 {title} 🎄"
+    + _MARGIN
+    + "║"
+    + "\n║                      For {number_of_guests} Guests                              ║\n"
+    + _BOT
+    + "\n"
+)
+_FOOTER = f"""
+{_RULE}
+                     🎅 Happy Christmas! 🎅
+{_RULE}
+"""
+
+_MENU_PROMPT = """
+Create a complete Christmas dinner menu:
+
+GUEST INFORMATION:
+- Number of guests: {number_of_guests}
+- Vegan guests: {vegan_guests}
+- Vegetarian guests: {vegetarian_guests}
+- Allergies to avoid: {allergens}
+- Prefer traditional: {prefer_traditional}
+
+APPETIZER SUGGESTIONS:
+{appetizer_suggestions}
+
+MAIN DISH SUGGESTIONS:
+{main_dish_suggestions}
+
+SECOND PLATE SUGGESTIONS:
+{second_plate_suggestions}
+
+DESSERT SUGGESTIONS:
+{dessert_suggestions}
+
+Instructions:
+1. Select best recipes from each category
+2. Ensure dietary requirements
+3. Suggest wine pairings
+4. Create preparation timeline
+5. Use format_final_menu tool to create beautiful menu
+"""
+
+# Served as-is when no guest has a dietary restriction or allergy
+_TRADITIONAL_CANNED = {
+    "title": "Traditional Christmas Dinner",
+    "appetizers": "• Crostini with chicken liver pâté\n• Antipasto of cured meats and cheeses",
+    "main_dishes": "• Tortellini in brodo\n• Lasagna alla bolognese",
+    "second_plates": "• Roasted turkey with potatoes\n• Baked sea bass",
+    "desserts": "• Panettone\n• Pandoro with mascarpone cream",
+}
+# Constraints the canned menu cannot honour; any of them set means the LLM plans
+_CANNED_MENU_CONSTRAINTS = (
+    "max_prep_time_minutes",
+    "max_cook_time_minutes",
+    "additional_notes",
+)
 
 
 @tool
@@ -13,8 +109,8 @@ def format_final_menu(
     second_plates: str,
     desserts: str,
     number_of_guests: int,
-    preparation_notes: str,
-    shopping_tips: str,
+    preparation_notes: str = "",
+    shopping_tips: str = "",
 ) -> str:
     """
     Format the final Christmas menu in a beautiful presentation format.
@@ -32,56 +128,25 @@ def format_final_menu(
     Returns:
         Beautifully formatted menu string
     """
-    menu = f"""
-╔══════════════════════════════════════════════════════════════════╗
-║                    🎄 {title.center(42)} 🎄                    ║
-║                      For {number_of_guests} Guests                              ║
-╚══════════════════════════════════════════════════════════════════╝
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🥗 APPETIZERS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{appetizers}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🍝 MAIN DISHES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{main_dishes}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🥩 SECOND PLATES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{second_plates}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🍰 DESSERTS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{desserts}
-"""
-
-    if preparation_notes:
-        menu += f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📋 PREPARATION TIMELINE
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{preparation_notes}
-"""
-
-    if shopping_tips:
-        menu += f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🛒 SHOPPING TIPS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{shopping_tips}
-"""
-
-    menu += """
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                     🎅 Happy Christmas! 🎅
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+    parts = [
+        _BANNER.format(title=_center_title(title), number_of_guests=number_of_guests)
+    ]
+    for emoji, heading, body in (
+        ("🥗", "APPETIZERS", appetizers),
+        ("🍝", "MAIN DISHES", main_dishes),
+        ("🥩", "SECOND PLATES", second_plates),
+        ("🍰", "DESSERTS", desserts),
+    ):
+        parts.append(_SECTION.format(emoji=emoji, heading=heading, body=body))
+    for emoji, heading, body in (
+        ("📋", "PREPARATION TIMELINE", preparation_notes),
+        ("🛒", "SHOPPING TIPS", shopping_tips),
+    ):
+        if body:
+            parts.append(_SECTION.format(emoji=emoji, heading=heading, body=body))
+    parts.append(_FOOTER)
 
-    return menu
+    return "".join(parts)
 
 
 class MenuCreatorAgent(Agent):
@@ -128,6 +193,11 @@ Consider:
 Plan your next steps to complete the menu creation."""
 
     name = "menu_creator"
+    MAX_CONCURRENT_AGENTS = 4
+    MENU_CACHE_SIZE = 256
+    # Tool schemas are built once when @tool decorates; the Agent appends
+    # connected agents to its tool list, so each instance gets its own copy
+    _TOOLS: ClassVar[tuple] = (format_final_menu,)
 
     def __init__(
         self,
@@ -142,9 +212,10 @@ Plan your next steps to complete the menu creation."""
             api_key: OpenAI API key (not needed for Ollama)
             provider: LLM provider override ("openai" or "ollama")
         """
+        # The Agent sends its system prompt with every client call, so the
+        # client does not need its own copy
         client = create_client(
             api_key=api_key,
-            system_prompt=self.SYSTEM_PROMPT,
             temperature=0.8,  # creative menu curation
             provider=provider,
         )
@@ -153,15 +224,18 @@ Plan your next steps to complete the menu creation."""
             name=self.name,
             client=client,
             system_prompt=self.SYSTEM_PROMPT,
-            tools=[format_final_menu],
+            tools=list(self._TOOLS),
             max_steps=10,
             terminate_on_text=True,
             planning_interval=3,
             planning_prompt=self.PLANNING_PROMPT,
         )
 
+        self._recipe_agents: list[Agent] = []
+        self._menu_cache: OrderedDict[str, str] = OrderedDict()
+        self._menu_cache_lock = threading.Lock()
         if recipe_agents:
-            self.can_call(recipe_agents)
+            self.connect_recipe_agents(recipe_agents)
 
     def connect_recipe_agents(self, recipe_agents: list[Agent]) -> None:
         """
@@ -171,6 +245,29 @@ Plan your next steps to complete the menu creation."""
             recipe_agents: List of specialized recipe agents
         """
         self.can_call(recipe_agents)
+        self._recipe_agents.extend(recipe_agents)
+
+    def _gather_suggestions(self, preferences: dict[str, Any]) -> dict[str, str]:
+        """
+        Run every connected recipe agent that exposes `search` concurrently.
+
+        Args:
+            preferences: User preferences dictionary
+
+        Returns:
+            Mapping of recipe category to the agent's raw suggestions
+        """
+        searchers = [a for a in self._recipe_agents if hasattr(a, "search")]
+        if not searchers:
+            return {}
+
+        def search(agent: Agent) -> tuple[str, str]:
+            result = agent.search(preferences)
+            return result["category"], result["raw_response"]
+
+        workers = min(self.MAX_CONCURRENT_AGENTS, len(searchers))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(pool.map(search, searchers))
 
     def _extract_preferences(self, preferences: dict[str, Any]) -> dict[str, Any]:
         """Centralized extraction of guest preferences and dietary info."""
@@ -180,27 +277,30 @@ Plan your next steps to complete the menu creation."""
 
         has_vegans = preferences.get("has_vegans", False)
         has_vegetarians = preferences.get("has_vegetarians", False)
-        allergies = preferences.get("allergies", [])
-        custom_allergies = preferences.get("custom_allergies", [])
-        if isinstance(allergies, str):
-            if not isinstance(custom_allergies, str):
-                if isinstance(custom_allergies, list):
-                    custom_allergies = ', '.join(custom_allergies)
-                else: 
-                    custom_allergies = ""
-        elif isinstance(allergies, list):
-            if not isinstance(custom_allergies, list):
-                if isinstance(custom_allergies, str):
-                    custom_allergies = [custom_allergies]
-                else: 
-                    custom_allergies = []
-        allergens = allergies + custom_allergies
+        allergens = as_allergy_list(preferences.get("allergies")) + as_allergy_list(
+            preferences.get("custom_allergies")
+        )
 
         return {
             "number_of_guests": number_of_guests,
             "has_vegans": has_vegans,
             "has_vegetarians": has_vegetarians,
             "allergens": allergens,
+            "allergens_str": ", ".join(allergens) if allergens else "None",
+        }
+
+    def _menu_result(
+        self, response_text: str, dietary_info: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the menu result dictionary from already-extracted dietary info."""
+        return {
+            "formatted_menu": response_text,
+            "number_of_guests": dietary_info["number_of_guests"],
+            "dietary_accommodations": {
+                "vegan_options": dietary_info["has_vegans"],
+                "vegetarian_options": dietary_info["has_vegetarians"],
+                "allergens_avoided": dietary_info["allergens"],
+            },
         }
 
     def _build_menu_prompt(
@@ -211,38 +311,50 @@ Plan your next steps to complete the menu creation."""
         second_plate_suggestions: str = "",
         dessert_suggestions: str = "",
         traditional: bool | None = None,
+        dietary_info: dict[str, Any] | None = None,
     ) -> str:
         """Centralized prompt builder to avoid repetition."""
-        dietary_info = self._extract_preferences(preferences)
-        return f"""
-Create a complete Christmas dinner menu:
-
-GUEST INFORMATION:
-- Number of guests: {dietary_info["number_of_guests"]}
-- Vegan guests: {preferences.get("vegan_count", 0) if dietary_info["has_vegans"] else "None"}
-- Vegetarian guests: {preferences.get("vegetarian_count", 0) if dietary_info["has_vegetarians"] else "None"}
-- Allergies to avoid: {", ".join(dietary_info["allergens"]) if dietary_info["allergens"] else "None"}
-- Prefer traditional: {"Yes" if traditional or preferences.get("prefer_traditional", True) else "No"}
-
-APPETIZER SUGGESTIONS:
-{appetizer_suggestions}
-
-MAIN DISH SUGGESTIONS:
-{main_dish_suggestions}
-
-SECOND PLATE SUGGESTIONS:
-{second_plate_suggestions}
-
-DESSERT SUGGESTIONS:
-{dessert_suggestions}
+        if dietary_info is None:
+            dietary_info = self._extract_preferences(preferences)
+        return _MENU_PROMPT.format(
+            number_of_guests=dietary_info["number_of_guests"],
+            vegan_guests=preferences.get("vegan_count", 0)
+            if dietary_info["has_vegans"]
+            else "None",
+            vegetarian_guests=preferences.get("vegetarian_count", 0)
+            if dietary_info["has_vegetarians"]
+            else "None",
+            allergens=dietary_info["allergens_str"],
+            prefer_traditional="Yes"
+            if traditional or preferences.get("prefer_traditional", True)
+            else "No",
+            appetizer_suggestions=appetizer_suggestions,
+            main_dish_suggestions=main_dish_suggestions,
+            second_plate_suggestions=second_plate_suggestions,
+            dessert_suggestions=dessert_suggestions,
+        )
 
-Instructions:
-1. Select best recipes from each category
-2. Ensure dietary requirements
-3. Suggest wine pairings
-4. Create preparation timeline
-5. Use format_final_menu tool to create beautiful menu
-"""
+    def _prepare(
+        self,
+        preferences: dict[str, Any],
+        appetizer_suggestions: str = "",
+        main_dish_suggestions: str = "",
+        second_plate_suggestions: str = "",
+        dessert_suggestions: str = "",
+        traditional: bool | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Extract dietary info once and build the menu prompt from it."""
+        dietary_info = self._extract_preferences(preferences)
+        prompt = self._build_menu_prompt(
+            preferences,
+            appetizer_suggestions,
+            main_dish_suggestions,
+            second_plate_suggestions,
+            dessert_suggestions,
+            traditional=traditional,
+            dietary_info=dietary_info,
+        )
+        return prompt, dietary_info
 
     def create_menu(
         self,
@@ -251,9 +363,12 @@ Instructions:
         main_dish_suggestions: str,
         second_plate_suggestions: str,
         dessert_suggestions: str,
+        cache: bool = False,
     ) -> dict[str, Any]:
         """
         Create the final Christmas menu from all recipe suggestions.
+        With cache=True, identical requests (same prompt) are answered from an
+        in-memory LRU cache; the orchestrator relies on its ResponseCache instead.
 
         Args:
             preferences: User preferences dictionary
@@ -261,11 +376,12 @@ Instructions:
             main_dish_suggestions: Raw output from MainDishAgent
             second_plate_suggestions: Raw output from SecondPlateAgent
             dessert_suggestions: Raw output from DessertAgent
+            cache: Whether to reuse a menu generated for the same prompt (off by default)
 
         Returns:
             Dictionary with the formatted menu and metadata
         """
-        prompt = self._build_menu_prompt(
+        prompt, dietary_info = self._prepare(
             preferences,
             appetizer_suggestions,
             main_dish_suggestions,
@@ -273,31 +389,87 @@ Instructions:
             dessert_suggestions,
         )
 
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        with self._menu_cache_lock:
+            cached = self._menu_cache.get(key) if cache else None
+            if cached is not None:
+                self._menu_cache.move_to_end(key)
+        if cached is not None:
+            return self._menu_result(cached, dietary_info)
+
         response = self.run(prompt, tool_choice="auto")
-        response_text = response.text if hasattr(response, "text") else str(response)
+        response_text = getattr(response, "text", None)
+        if response_text is None:
+            response_text = str(response)
 
-        dietary_info = self._extract_preferences(preferences)
-        return {
-            "formatted_menu": response_text,
-            "number_of_guests": dietary_info["number_of_guests"],
-            "dietary_accommodations": {
-                "vegan_options": dietary_info["has_vegans"],
-                "vegetarian_options": dietary_info["has_vegetarians"],
-                "allergens_avoided": dietary_info["allergens"],
-            },
-        }
+        with self._menu_cache_lock:
+            self._menu_cache[key] = response_text
+            self._menu_cache.move_to_end(key)
+            if len(self._menu_cache) > self.MENU_CACHE_SIZE:
+                self._menu_cache.popitem(last=False)
+
+        return self._menu_result(response_text, dietary_info)
 
-    def create_menu_streaming(
+    async def create_menu_batch_async(
+        self,
+        items: list[tuple[dict[str, Any], str, str, str, str]],
+        max_concurrency: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Create several menus concurrently.
+
+        Args:
+            items: (preferences, appetizer, main dish, second plate, dessert suggestions) tuples
+            max_concurrency: Maximum number of menus generated at the same time
+
+        Returns:
+            One menu result dictionary per item, in the same order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_one(
+            preferences: dict[str, Any], *suggestions: str
+        ) -> dict[str, Any]:
+            prompt, dietary_info = self._prepare(preferences, *suggestions)
+            async with semaphore:
+                response = await self.a_run(prompt, tool_choice="auto")
+            response_text = (
+                response.text if response.text is not None else str(response)
+            )
+            return self._menu_result(response_text, dietary_info)
+
+        return list(await asyncio.gather(*(create_one(*item) for item in items)))
+
+    def create_menu_batch(
+        self,
+        items: list[tuple[dict[str, Any], str, str, str, str]],
+        max_concurrency: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Create several menus concurrently from synchronous code.
+        From async code, await create_menu_batch_async instead.
+
+        Args:
+            items: (preferences, appetizer, main dish, second plate, dessert suggestions) tuples
+            max_concurrency: Maximum number of menus generated at the same time
+
+        Returns:
+            One menu result dictionary per item, in the same order
+        """
+        return asyncio.run(self.create_menu_batch_async(items, max_concurrency))
+
+    async def create_menu_streaming(
         self,
         preferences: dict[str, Any],
         appetizer_suggestions: str,
         main_dish_suggestions: str,
         second_plate_suggestions: str,
         dessert_suggestions: str,
-    ) -> Generator:
+    ) -> AsyncGenerator[Any, None]:
         """
-        Create the final Christmas menu with streaming progress.
-        Yields step-by-step progress during menu creation.
+        Create the final Christmas menu with async streaming progress.
+        Yields step-by-step progress during menu creation without blocking
+        the event loop between steps.
 
         Args:
             preferences: User preferences dictionary
@@ -309,7 +481,7 @@ Instructions:
         Yields:
             StepResult objects with progress information
         """
-        prompt = self._build_menu_prompt(
+        prompt, _ = self._prepare(
             preferences,
             appetizer_suggestions,
             main_dish_suggestions,
@@ -317,13 +489,51 @@ Instructions:
             dessert_suggestions,
         )
 
-        for step in self.stream_invoke(prompt):
+        async for step in self.a_stream_invoke(prompt):
             yield step
 
+    def create_menu_streaming_sync(
+        self,
+        preferences: dict[str, Any],
+        appetizer_suggestions: str,
+        main_dish_suggestions: str,
+        second_plate_suggestions: str,
+        dessert_suggestions: str,
+    ) -> Generator:
+        """
+        Synchronous wrapper around create_menu_streaming for non-async callers.
+        Each step is yielded as soon as it arrives.
+
+        Yields:
+            StepResult objects with progress information
+        """
+        steps = self.create_menu_streaming(
+            preferences,
+            appetizer_suggestions,
+            main_dish_suggestions,
+            second_plate_suggestions,
+            dessert_suggestions,
+        )
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(steps.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(steps.aclose())
+            loop.close()
+
     def create_menu_with_agents(self, preferences: dict[str, Any]) -> dict[str, Any]:
         """
         Create menu by directly calling connected recipe agents via can_call().
         This demonstrates native multi-agent collaboration.
+        Connected course agents are queried concurrently up front, so the menu
+        creator composes from their suggestions in one run instead of calling
+        them one tool turn at a time. Traditional menus with no dietary
+        restrictions, allergies, difficulty or time limits and no notes are
+        served from a canned template without calling the LLM.
 
         Args:
             preferences: User preferences dictionary
@@ -331,17 +541,32 @@ Instructions:
         Returns:
             Dictionary with the formatted menu and metadata
         """
-        prompt = self._build_menu_prompt(preferences, traditional=True)
+        dietary_info = self._extract_preferences(preferences)
+        if (
+            not dietary_info["has_vegans"]
+            and not dietary_info["has_vegetarians"]
+            and not dietary_info["allergens"]
+            and preferences.get("prefer_traditional", True)
+            and preferences.get("max_difficulty") in (None, "medium")
+            and not any(preferences.get(key) for key in _CANNED_MENU_CONSTRAINTS)
+        ):
+            menu = format_final_menu(
+                **_TRADITIONAL_CANNED,
+                number_of_guests=dietary_info["number_of_guests"],
+            )
+            return self._menu_result(menu, dietary_info)
+
+        suggestions = self._gather_suggestions(preferences)
+        prompt = self._build_menu_prompt(
+            preferences,
+            suggestions.get("appetizer", ""),
+            suggestions.get("main_dish", ""),
+            suggestions.get("second_plate", ""),
+            suggestions.get("dessert", ""),
+            traditional=True,
+            dietary_info=dietary_info,
+        )
         response = self.run(prompt, tool_choice="auto")
-        response_text = getattr(response, "text", str(response))
+        response_text = response.text if response.text is not None else str(response)
 
-        dietary_info = self._extract_preferences(preferences)
-        return {
-            "formatted_menu": response_text,
-            "number_of_guests": dietary_info["number_of_guests"],
-            "dietary_accommodations": {
-                "vegan_options": dietary_info["has_vegans"],
-                "vegetarian_options": dietary_info["has_vegetarians"],
-                "allergens_avoided": dietary_info["allergens"],
-            },
-        }
+        return self._menu_result(response_text, dietary_info)
@@ -1,10 +1,18 @@
+import asyncio
+import re
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from typing import Any, Generator, AsyncGenerator
 
 from loguru import logger
+from pydantic import ValidationError
 
 from ..config import settings, get_provider_name, get_model_name
 from ..agents.info_checker import InfoCheckerAgent
 from ..agents.recipe_agents import (
+    AllCoursesAgent,
     AppetizerAgent,
     MainDishAgent,
     RecipeResearchAgent,
@@ -12,8 +20,88 @@ from ..agents.recipe_agents import (
     DessertAgent,
 )
 from ..agents.menu_creator import MenuCreatorAgent
+from ..database.extraction_cache import ExtractionCache
+from ..database.response_cache import ResponseCache
 from ..database.vector_store import RecipeVectorStore
 from ..database.recipe_loader import RecipeLoader
+from ..models.user_preferences import UserPreferences
+
+# Used when the user did not give enough information and defaults are accepted
+_DEFAULT_PREFERENCES = types.MappingProxyType(
+    {
+        "number_of_guests": 6,
+        "has_vegetarians": False,
+        "vegetarian_count": 0,
+        "has_vegans": False,
+        "vegan_count": 0,
+        "prefer_traditional": True,
+        "max_difficulty": "medium",
+    }
+)
+
+
+def _default_prefs() -> dict[str, Any]:
+    """Return a fresh copy of the default preferences."""
+    return {**_DEFAULT_PREFERENCES, "allergies": [], "custom_allergies": []}
+
+
+# (category, orchestrator attribute, streaming status message) for Step 2
+_RECIPE_SEARCHES = (
+    ("appetizer", "appetizer_agent", "🥗 Searching appetizers..."),
+    ("main_dish", "main_dish_agent", "🍝 Searching main dishes..."),
+    ("second_plate", "second_plate_agent", "🥩 Searching second plates..."),
+    ("dessert", "dessert_agent", "🍰 Searching desserts..."),
+)
+# Step 2 progress for run(), emitted as one log record
+_SEARCH_LOG = (
+    "\n🔍 Step 2: Searching for recipes...\n"
+    "   • Searching appetizers...\n"
+    "   • Searching main dishes...\n"
+    "   • Searching second plates...\n"
+    "   • Searching desserts..."
+)
+
+
+def _step_parts(step: Any) -> tuple[str, str | None]:
+    """
+    Split a streamed menu step into its full text and, for token chunks, the delta.
+    Streamed chunks carry cumulative text, so only the delta is new.
+    """
+    text = getattr(step, "text", None)
+    if text is None:
+        text = str(step)
+    delta = getattr(step, "delta", None)
+    return text, delta if isinstance(delta, str) else None
+
+
+# Guest counts must match exactly even when two requests embed as near-identical
+_NUMBERS = re.compile(r"\d+")
+
+# Preferences that must match exactly before a similar request's menu is reused
+_RESULT_CACHE_FIELDS = (
+    "number_of_guests",
+    "has_vegans",
+    "vegan_count",
+    "has_vegetarians",
+    "vegetarian_count",
+    "allergies",
+    "custom_allergies",
+    "prefer_traditional",
+)
+
+
+def _preference_signature(preferences: dict[str, Any]) -> list[Any]:
+    """Reduce preferences to the fields that decide whether a menu can be reused."""
+    return [
+        sorted(str(a).strip().lower() for a in preferences.get(name) or [])
+        if name.endswith("allergies")
+        else preferences.get(name)
+        for name in _RESULT_CACHE_FIELDS
+    ]
+
+
+# Headers, emphasis and horizontal rules carry no content for the menu creator
+_MARKDOWN_MARKERS = re.compile(r"^\s*#+\s*|\*\*|__|^\s*[-*_]{3,}\s*$")
 
 
 class ChristmasMenuOrchestrator:
@@ -41,41 +129,100 @@ class ChristmasMenuOrchestrator:
         api_key: str | None = None,
         provider: str | None = None,
         initialize_db: bool = True,
+        use_cache: bool | None = None,
+        cache: ResponseCache | None = None,
+        semantic_cache: ExtractionCache | None = None,
     ):
         """
-        Initialize the orchestrator with all agents.
+        Initialize the orchestrator. Agents are created lazily on first use.
 
         Args:
             api_key: OpenAI API key (not needed for Ollama)
             provider: LLM provider override ("openai" or "ollama")
             initialize_db: Whether to initialize the vector database with sample recipes.
+            use_cache: Whether to reuse responses for repeated requests. Uses settings default if None.
+            cache: Custom response cache instance (useful for testing)
+            semantic_cache: Custom cache of whole results by request similarity (useful for testing)
         """
         self.api_key = api_key
         self.provider = provider or settings.LLM_PROVIDER
+        self._provider_info = f"{get_provider_name()} ({get_model_name()})"
 
-        self.info_checker = InfoCheckerAgent(
-            api_key=self.api_key, provider=self.provider
-        )
-        self.appetizer_agent = AppetizerAgent(
-            api_key=self.api_key, provider=self.provider
+        # The recipe searches are independent network-bound LLM calls
+        self._pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="recipe-search"
         )
-        self.main_dish_agent = MainDishAgent(
-            api_key=self.api_key, provider=self.provider
-        )
-        self.second_plate_agent = SecondPlateAgent(
-            api_key=self.api_key, provider=self.provider
-        )
-        self.dessert_agent = DessertAgent(api_key=self.api_key, provider=self.provider)
 
-        self.recipe_researcher = RecipeResearchAgent(
+        self._cache = cache
+        if self._cache is None and (
+            settings.RESPONSE_CACHE_ENABLED if use_cache is None else use_cache
+        ):
+            self._cache = ResponseCache()
+
+        self._semantic_cache = semantic_cache
+        if self._semantic_cache is None and settings.SEMANTIC_CACHE_ENABLED:
+            from datapizza.embedders.openai import OpenAIEmbedder  # type: ignore
+
+            self._semantic_cache = ExtractionCache(
+                path=settings.SEMANTIC_CACHE_PATH,
+                namespace="pipeline",
+                embedder=OpenAIEmbedder(
+                    api_key=api_key or settings.OPENAI_API_KEY,
+                    model_name=settings.EMBEDDING_MODEL,
+                ),
+                similarity_threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            )
+
+        # Agents are created on first use. Sample recipes load in the
+        # background; only the pipelines and database methods wait for them.
+        self._db_ready = threading.Event()
+        if initialize_db:
+            # Created here so the loader thread never races the cached property
+            _ = self.vector_store
+            threading.Thread(
+                target=self._load_recipes_background,
+                name="recipe-loader",
+                daemon=True,
+            ).start()
+        else:
+            self._db_ready.set()
+
+    @cached_property
+    def info_checker(self) -> InfoCheckerAgent:
+        return InfoCheckerAgent(api_key=self.api_key, provider=self.provider)
+
+    @cached_property
+    def appetizer_agent(self) -> AppetizerAgent:
+        return AppetizerAgent.get_instance(api_key=self.api_key, provider=self.provider)
+
+    @cached_property
+    def main_dish_agent(self) -> MainDishAgent:
+        return MainDishAgent.get_instance(api_key=self.api_key, provider=self.provider)
+
+    @cached_property
+    def second_plate_agent(self) -> SecondPlateAgent:
+        return SecondPlateAgent.get_instance(
             api_key=self.api_key, provider=self.provider
         )
 
-        self.menu_creator = MenuCreatorAgent(
+    @cached_property
+    def dessert_agent(self) -> DessertAgent:
+        return DessertAgent.get_instance(api_key=self.api_key, provider=self.provider)
+
+    @cached_property
+    def all_courses_agent(self) -> AllCoursesAgent:
+        return AllCoursesAgent.get_instance(
             api_key=self.api_key, provider=self.provider
         )
 
-        self.menu_creator.connect_recipe_agents(
+    @cached_property
+    def recipe_researcher(self) -> RecipeResearchAgent:
+        return RecipeResearchAgent(api_key=self.api_key, provider=self.provider)
+
+    @cached_property
+    def menu_creator(self) -> MenuCreatorAgent:
+        menu_creator = MenuCreatorAgent(api_key=self.api_key, provider=self.provider)
+        menu_creator.connect_recipe_agents(
             [
                 self.appetizer_agent,
                 self.main_dish_agent,
@@ -84,11 +231,35 @@ class ChristmasMenuOrchestrator:
                 self.recipe_researcher,
             ]
         )
-
-        self.vector_store = RecipeVectorStore()
-
-        if initialize_db:
+        return menu_creator
+
+    @cached_property
+    def vector_store(self) -> RecipeVectorStore:
+        return RecipeVectorStore()
+
+    def warmup(self) -> None:
+        """Create every agent and load the database up front."""
+        # Accessing the cached properties builds the agents (and the course agents)
+        _ = self.info_checker, self.menu_creator
+        self._ensure_db()
+
+    def _prefetch(self) -> None:
+        """Build the recipe and menu agents and load the database."""
+        _ = self.menu_creator
+        self._ensure_db()
+
+    def _load_recipes_background(self) -> None:
+        """Load sample recipes off the caller's thread."""
+        try:
             self._ensure_recipes_loaded()
+        except Exception as e:
+            logger.error(f"❌ Failed to load sample recipes: {e}")
+        finally:
+            self._db_ready.set()
+
+    def _ensure_db(self, timeout: float | None = None) -> None:
+        """Wait until the background recipe load has finished."""
+        self._db_ready.wait(timeout)
 
     def _ensure_recipes_loaded(self) -> None:
         """Ensure the vector database has recipes loaded."""
@@ -98,16 +269,285 @@ class ChristmasMenuOrchestrator:
             count = loader.load_sample_recipes()
             logger.info(f"✅ Loaded {count} sample recipes")
 
+    def _result_cache_usable(
+        self,
+        user_request: str | dict[str, Any],
+        interactive: bool = False,
+        isolated: bool = False,
+    ) -> bool:
+        """
+        Whether whole results may be reused for this request.
+        Interactive runs and follow-up turns depend on more than the message itself.
+        """
+        return (
+            self._semantic_cache is not None
+            and isinstance(user_request, str)
+            and not interactive
+            and (isolated or not self.info_checker.has_context)
+        )
+
+    def _cached_result(
+        self, user_request: str, preferences: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """
+        Return the result of an earlier, similar request, or None.
+        Diets, allergies and guest counts must match exactly: requests such as
+        "nut allergy" and "no allergies" embed almost identically.
+        """
+        cached = self._semantic_cache.get(user_request)
+        if (
+            not cached
+            or cached[0]["numbers"] != _NUMBERS.findall(user_request)
+            or cached[0].get("signature") != _preference_signature(preferences)
+        ):
+            return None
+        return cached[0]["result"]
+
+    def _store_result(self, user_request: str, result: dict[str, Any]) -> None:
+        """Remember a successful result for similar future requests."""
+        if result["success"]:
+            self._semantic_cache.set(
+                user_request,
+                [
+                    {
+                        "numbers": _NUMBERS.findall(user_request),
+                        "signature": _preference_signature(result["preferences"]),
+                        "result": result,
+                    }
+                ],
+            )
+
+    def _extract_preferences(
+        self,
+        user_request: str | dict[str, Any],
+        info_checker: InfoCheckerAgent | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extract preferences, reusing the result for a repeated request.
+        Structured requests are validated directly, without calling the info checker.
+        """
+        info_checker = info_checker or self.info_checker
+        if isinstance(user_request, dict):
+            try:
+                preferences = UserPreferences(**user_request).model_dump()
+            except ValidationError as e:
+                logger.warning(f"⚠️  Invalid preferences: {e}")
+                return {
+                    "raw_response": "",
+                    "is_complete": False,
+                    "skipped": True,
+                    "response_text": "",
+                    "preferences": None,
+                    "missing_info": sorted(
+                        {str(error["loc"][0]) for error in e.errors() if error["loc"]}
+                    ),
+                    "questions": [],
+                    "summary": "",
+                    "error": str(e),
+                }
+            return {"is_complete": True, "skipped": True, "preferences": preferences}
+
+        # Follow-up turns depend on the conversation so far, not just this message
+        use_cache = self._cache is not None and not info_checker.has_context
+        key = ("info_checker", info_checker.system_prompt, user_request)
+        if use_cache:
+            cached = self._cache.get(*key)
+            if cached is not None:
+                return cached
+
+        preferences_result = info_checker.extract_preferences(user_request)
+
+        # Incomplete results lead to follow-up questions, so they are not reused
+        if use_cache and preferences_result.get("is_complete"):
+            self._cache.set(preferences_result, *key)
+        return preferences_result
+
+    def _extract_isolated(self, user_request: str | dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract preferences as the first turn of a new conversation.
+        A fresh info checker is used, so the shared conversation is left untouched.
+        """
+        if isinstance(user_request, dict):
+            return self._extract_preferences(user_request)
+
+        return self._extract_preferences(
+            user_request,
+            InfoCheckerAgent(api_key=self.api_key, provider=self.provider),
+        )
+
+    @staticmethod
+    def _resolve_preferences(preferences_result: dict[str, Any]) -> dict[str, Any]:
+        """Pick the extracted preferences, falling back to defaults when incomplete."""
+        if preferences_result.get("is_complete"):
+            return preferences_result.get("preferences", {})
+        return preferences_result.get("preferences") or _default_prefs()
+
+    def _cached_search(
+        self, agent: Any, preferences: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Return the cached search result for an agent, or None."""
+        if self._cache is None:
+            return None
+        return self._cache.get(agent.name, agent.system_prompt, preferences)
+
+    def _search(self, agent: Any, preferences: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a recipe agent search, reusing the result for repeated preferences.
+        A failed search returns an empty suggestion with the error instead of raising.
+        """
+        cached = self._cached_search(agent, preferences)
+        if cached is not None:
+            return cached
+
+        try:
+            search_result = agent.search(preferences)
+        except Exception as e:
+            # One failed course should not abort the whole menu
+            logger.error(f"❌ {agent.CATEGORY} search failed: {e}")
+            return {"category": agent.CATEGORY, "raw_response": "", "error": str(e)}
+
+        if self._cache is not None:
+            self._cache.set(search_result, agent.name, agent.system_prompt, preferences)
+        return search_result
+
+    def _search_all(
+        self, preferences: dict[str, Any]
+    ) -> dict[str, dict[str, Any]] | None:
+        """
+        Search every course with one structured call when BATCH_SEARCH is enabled.
+        Returns None to fall back to the per-course agents.
+        """
+        if not settings.BATCH_SEARCH:
+            return None
+
+        agent = self.all_courses_agent
+        key = (agent.name, agent.system_prompt, preferences)
+        if self._cache is not None:
+            cached = self._cache.get(*key)
+            if cached is not None:
+                return cached
+
+        try:
+            search_results = agent.search_all(preferences)
+        except Exception as e:
+            logger.warning(f"⚠️  Batched search failed, searching each course: {e}")
+            return None
+
+        if self._cache is not None:
+            self._cache.set(search_results, *key)
+        return search_results
+
+    def _plan_searches(
+        self, preferences: dict[str, Any]
+    ) -> tuple[list[tuple[str, dict[str, Any], bool]], list[tuple[str, Any]]]:
+        """
+        Split the Step 2 searches into known results and searches still to run.
+
+        Returns:
+            (category, result, cached) for batched or cached courses, and
+            (category, agent) for every course that still needs a search
+        """
+        batched = self._search_all(preferences)
+        if batched is not None:
+            return [(c, batched[c], False) for c, _, _ in _RECIPE_SEARCHES], []
+
+        ready, pending = [], []
+        for category, agent_name, _ in _RECIPE_SEARCHES:
+            agent = getattr(self, agent_name)
+            cached = self._cached_search(agent, preferences)
+            if cached is not None:
+                ready.append((category, cached, True))
+            else:
+                pending.append((category, agent))
+        return ready, pending
+
+    def _iter_searches(
+        self, preferences: dict[str, Any]
+    ) -> Generator[tuple[str, dict[str, Any], bool], None, None]:
+        """
+        Run the Step 2 searches on the pool.
+        Yields (category, result, cached) as each search completes.
+        """
+        ready, pending = self._plan_searches(preferences)
+        futures = {
+            self._pool.submit(self._search, agent, preferences): category
+            for category, agent in pending
+        }
+        try:
+            yield from ready
+            for future in as_completed(futures):
+                yield futures[future], future.result(), False
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _menu_suggestions(
+        self, recipe_results: dict[str, dict[str, Any]]
+    ) -> dict[str, str]:
+        """Build the condensed suggestion arguments for the menu creator."""
+        return {
+            f"{category}_suggestions": self._condense_suggestions(
+                recipe_results[category].get("raw_response", "")
+            )
+            for category, _, _ in _RECIPE_SEARCHES
+        }
+
+    def _create_menu(
+        self, preferences: dict[str, Any], suggestions: dict[str, str]
+    ) -> dict[str, Any]:
+        """Create the menu, reusing the stored menu for repeated inputs."""
+        key = (
+            self.menu_creator.name,
+            self.menu_creator.system_prompt,
+            preferences,
+            suggestions,
+        )
+        if self._cache is not None:
+            cached = self._cache.get(*key)
+            if cached is not None:
+                return cached
+
+        menu_result = self.menu_creator.create_menu(
+            preferences=preferences, **suggestions
+        )
+        if self._cache is not None:
+            self._cache.set(menu_result, *key)
+        return menu_result
+
+    @staticmethod
+    def _condense_suggestions(text: str, max_chars: int = 1600) -> str:
+        """
+        Shrink a recipe agent's answer before it is sent to the menu creator.
+        Drops markdown markers, blank and repeated lines, then cuts at a line
+        boundary once max_chars (about 400 tokens) is reached.
+        """
+        lines = dict.fromkeys(
+            stripped
+            for line in text.splitlines()
+            if (stripped := _MARKDOWN_MARKERS.sub("", line).strip())
+        )
+
+        kept, size = [], 0
+        for line in lines:
+            size += len(line) + 1
+            if size > max_chars and kept:
+                break
+            kept.append(line)
+        return "\n".join(kept)
+
     def get_provider_info(self) -> str:
         """Get information about the current LLM provider."""
-        return f"{get_provider_name()} ({get_model_name()})"
+        return self._provider_info
 
-    def run(self, user_request: str, interactive: bool = False) -> dict[str, Any]:
+    def run(
+        self, user_request: str | dict[str, Any], interactive: bool = False
+    ) -> dict[str, Any]:
         """
         Run the complete menu planning pipeline.
 
         Args:
-            user_request: The user's request for a Christmas menu
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
             interactive: If True, will prompt for missing information
 
         Returns:
@@ -122,6 +562,8 @@ class ChristmasMenuOrchestrator:
         logger.info(f"Using: {self.get_provider_info()}")
         logger.info("=" * 50)
 
+        use_result_cache = self._result_cache_usable(user_request, interactive)
+
         result: dict[str, Any] = {
             "success": False,
             "menu": None,
@@ -132,68 +574,45 @@ class ChristmasMenuOrchestrator:
         }
 
         logger.info("\n📋 Step 1: Analyzing your requirements...")
-        preferences_result = self.info_checker.extract_preferences(user_request)
+        preferences_result = self._extract_preferences(user_request)
         result["agent_outputs"]["info_checker"] = preferences_result
 
         if not preferences_result.get("is_complete"):
             if interactive:
                 logger.warning("⚠️  Some information is missing. Please provide:")
                 questions = self.info_checker.ask_missing_info(
-                    preferences_result.get("preferences", {}),
+                    preferences_result.get("preferences") or {},
                     preferences_result.get("missing_info", []),
                 )
                 logger.info(questions)
                 result["error"] = "Missing required information"
                 return result
-            else:
-                logger.warning("⚠️  Using defaults for missing information")
-                preferences = preferences_result.get("preferences") or {
-                    "number_of_guests": 6,
-                    "has_vegetarians": False,
-                    "vegetarian_count": 0,
-                    "has_vegans": False,
-                    "vegan_count": 0,
-                    "allergies": [],
-                    "custom_allergies": [],
-                    "prefer_traditional": True,
-                    "max_difficulty": "medium",
-                }
-        else:
-            preferences = preferences_result.get("preferences", {})
+            logger.warning("⚠️  Using defaults for missing information")
 
+        preferences = self._resolve_preferences(preferences_result)
         result["preferences"] = preferences
         logger.info(
             f"✅ Preferences extracted: {preferences.get('number_of_guests', 'N/A')} guests"
         )
 
-        # Step 2: Search for recipes using specialized agents
-        logger.info("\n🔍 Step 2: Searching for recipes...")
-        logger.info("   • Searching appetizers...")
-        appetizer_result = self.appetizer_agent.search(preferences)
-        result["agent_outputs"]["appetizer"] = appetizer_result
-
-        logger.info("   • Searching main dishes...")
-        main_dish_result = self.main_dish_agent.search(preferences)
-        result["agent_outputs"]["main_dish"] = main_dish_result
+        if use_result_cache:
+            cached = self._cached_result(user_request, preferences)
+            if cached is not None:
+                logger.info("✅ Reusing the menu of a similar earlier request")
+                return cached
 
-        logger.info("   • Searching second plates...")
-        second_plate_result = self.second_plate_agent.search(preferences)
-        result["agent_outputs"]["second_plate"] = second_plate_result
-
-        logger.info("   • Searching desserts...")
-        dessert_result = self.dessert_agent.search(preferences)
-        result["agent_outputs"]["dessert"] = dessert_result
+        # Step 2: Search for recipes using specialized agents
+        self._ensure_db()
+        logger.info(_SEARCH_LOG)
+        for category, search_result, _ in self._iter_searches(preferences):
+            result["agent_outputs"][category] = search_result
 
         logger.info("✅ Recipe search complete!")
 
         # Step 3: Create the final menu using planning_interval
         logger.info("\n📝 Step 3: Creating your personalized menu...")
-        menu_result = self.menu_creator.create_menu(
-            preferences=preferences,
-            appetizer_suggestions=appetizer_result.get("raw_response", ""),
-            main_dish_suggestions=main_dish_result.get("raw_response", ""),
-            second_plate_suggestions=second_plate_result.get("raw_response", ""),
-            dessert_suggestions=dessert_result.get("raw_response", ""),
+        menu_result = self._create_menu(
+            preferences, self._menu_suggestions(result["agent_outputs"])
         )
 
         result["agent_outputs"]["menu_creator"] = menu_result
@@ -203,15 +622,20 @@ class ChristmasMenuOrchestrator:
         logger.info("✅ Menu created successfully!")
         logger.info("\n" + "=" * 50)
 
+        if use_result_cache:
+            self._store_result(user_request, result)
         return result
 
-    def run_streaming(self, user_request: str) -> Generator[dict[str, Any], None, None]:
+    def run_streaming(
+        self, user_request: str | dict[str, Any]
+    ) -> Generator[dict[str, Any], None, None]:
         """
         Run the pipeline with streaming progress updates.
         Uses stream_invoke() for real-time feedback.
 
         Args:
-            user_request: The user's request for a Christmas menu
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
 
         Yields:
             Progress updates at each step
@@ -223,26 +647,14 @@ class ChristmasMenuOrchestrator:
 
         # Step 1: Extract preferences
         yield {"type": "status", "message": "📋 Analyzing your requirements..."}
-        preferences_result = self.info_checker.extract_preferences(user_request)
+        preferences_result = self._extract_preferences(user_request)
 
+        preferences = self._resolve_preferences(preferences_result)
         if not preferences_result.get("is_complete"):
-            preferences = preferences_result.get("preferences") or {
-                "number_of_guests": 6,
-                "has_vegetarians": False,
-                "vegetarian_count": 0,
-                "has_vegans": False,
-                "vegan_count": 0,
-                "allergies": [],
-                "custom_allergies": [],
-                "prefer_traditional": True,
-                "max_difficulty": "medium",
-            }
             yield {
                 "type": "warning",
                 "message": "⚠️ Using defaults for missing information",
             }
-        else:
-            preferences = preferences_result.get("preferences", {})
 
         yield {
             "type": "progress",
@@ -251,47 +663,43 @@ class ChristmasMenuOrchestrator:
             "data": preferences,
         }
 
-        # Step 2: Search recipes with streaming progress
-        recipe_agents = [
-            ("appetizer", self.appetizer_agent, "🥗 Searching appetizers..."),
-            ("main_dish", self.main_dish_agent, "🍝 Searching main dishes..."),
-            ("second_plate", self.second_plate_agent, "🥩 Searching second plates..."),
-            ("dessert", self.dessert_agent, "🍰 Searching desserts..."),
-        ]
+        # Step 2: Search recipes concurrently, reporting each as it completes
+        self._ensure_db()
+        for _, _, message in _RECIPE_SEARCHES:
+            yield {"type": "status", "message": message}
 
         recipe_results = {}
-        for category, agent, message in recipe_agents:
-            yield {"type": "status", "message": message}
-            result = agent.search(preferences)
-            recipe_results[category] = result
-            yield {
+        for category, search_result, cached in self._iter_searches(preferences):
+            recipe_results[category] = search_result
+            event = {
                 "type": "progress",
                 "step": category,
                 "message": f"✅ Found {category.replace('_', ' ')} suggestions",
-                "data": result,
+                "data": search_result,
             }
+            if cached:
+                event["cached"] = True
+            yield event
 
         # Step 3: Create menu with streaming
         yield {"type": "status", "message": "📝 Creating your personalized menu..."}
 
         # Stream menu creation steps
         final_menu = None
-        for step in self.menu_creator.create_menu_streaming(
-            preferences=preferences,
-            appetizer_suggestions=recipe_results["appetizer"].get("raw_response", ""),
-            main_dish_suggestions=recipe_results["main_dish"].get("raw_response", ""),
-            second_plate_suggestions=recipe_results["second_plate"].get(
-                "raw_response", ""
-            ),
-            dessert_suggestions=recipe_results["dessert"].get("raw_response", ""),
+        for step in self.menu_creator.create_menu_streaming_sync(
+            preferences=preferences, **self._menu_suggestions(recipe_results)
         ):
-            step_text = step.text if hasattr(step, "text") else str(step)
+            step_text, delta = _step_parts(step)
+            if delta is not None:
+                message = delta
+            elif len(step_text) > 100:
+                message = step_text[:100] + "..."
+            else:
+                message = step_text
             yield {
                 "type": "step",
-                "step_index": step.index if hasattr(step, "index") else 0,
-                "message": step_text[:100] + "..."
-                if len(step_text) > 100
-                else step_text,
+                "step_index": getattr(step, "index", 0),
+                "message": message,
             }
             final_menu = step_text
 
@@ -302,16 +710,129 @@ class ChristmasMenuOrchestrator:
             "preferences": preferences,
         }
 
-    async def run_async(self, user_request: str) -> dict[str, Any]:
+    async def _run_async_core(
+        self,
+        user_request: str | dict[str, Any],
+        stream_menu: bool = True,
+        isolated: bool = False,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Shared async pipeline behind run_async() and run_async_streaming().
+
+        Args:
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
+            stream_menu: Stream the menu step by step; if False the menu is
+                created in one call and its result is attached to the complete event
+            isolated: Extract preferences without the info checker's earlier turns
+
+        Yields:
+            Progress updates at each step
+        """
+        yield {
+            "type": "status",
+            "message": f"🎄 Starting Christmas Menu Planner (Async - {self.get_provider_info()})...",
+        }
+
+        # Step 1: Extract preferences while the recipe agents and database warm up
+        yield {"type": "status", "message": "📋 Analyzing your requirements..."}
+        prefetch = asyncio.create_task(asyncio.to_thread(self._prefetch))
+        preferences_result = await asyncio.to_thread(
+            self._extract_isolated if isolated else self._extract_preferences,
+            user_request,
+        )
+
+        preferences = self._resolve_preferences(preferences_result)
+
+        yield {
+            "type": "progress",
+            "step": "info_checker",
+            "message": "✅ Preferences extracted",
+            "data": preferences,
+            "output": preferences_result,
+        }
+
+        await prefetch
+
+        # Step 2: Search recipes concurrently, reporting each as it completes
+        async def search(category: str, agent: Any) -> tuple[str, dict[str, Any]]:
+            return category, await asyncio.to_thread(self._search, agent, preferences)
+
+        ready, pending = await asyncio.to_thread(self._plan_searches, preferences)
+        searches = [
+            asyncio.create_task(search(category, agent)) for category, agent in pending
+        ]
+
+        # Searches still running when the consumer stops iterating are cancelled
+        recipe_results = {}
+        try:
+            for category, _, _ in _RECIPE_SEARCHES:
+                yield {
+                    "type": "status",
+                    "message": f"🔍 Searching {category.replace('_', ' ')}...",
+                }
+
+            for category, search_result, cached in ready:
+                recipe_results[category] = search_result
+                event = {"type": "progress", "step": category, "data": search_result}
+                if cached:
+                    event["cached"] = True
+                yield event
+
+            for next_done in asyncio.as_completed(searches):
+                category, search_result = await next_done
+                recipe_results[category] = search_result
+                yield {"type": "progress", "step": category, "data": search_result}
+        finally:
+            for task in searches:
+                task.cancel()
+
+        # Step 3: Create menu
+        yield {"type": "status", "message": "📝 Creating menu..."}
+        suggestions = self._menu_suggestions(recipe_results)
+
+        if not stream_menu:
+            menu_result = await asyncio.to_thread(
+                self._create_menu, preferences, suggestions
+            )
+            yield {
+                "type": "complete",
+                "menu": menu_result.get("formatted_menu", ""),
+                "preferences": preferences,
+                "output": menu_result,
+            }
+            return
+
+        final_menu = None
+        async for step in self.menu_creator.create_menu_streaming(
+            preferences=preferences, **suggestions
+        ):
+            final_menu, delta = _step_parts(step)
+            yield {"type": "step", "message": final_menu if delta is None else delta}
+
+        yield {"type": "complete", "menu": final_menu, "preferences": preferences}
+
+    async def run_async(self, user_request: str | dict[str, Any]) -> dict[str, Any]:
         """
         Run the pipeline asynchronously using true async execution.
 
         Args:
-            user_request: The user's request for a Christmas menu
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
 
         Returns:
             Same as run()
         """
+        return await self._run_async_result(user_request)
+
+    async def _run_async_result(
+        self, user_request: str | dict[str, Any], isolated: bool = False
+    ) -> dict[str, Any]:
+        """Run the async pipeline and fold its events into a run() style result."""
+        use_result_cache = await asyncio.to_thread(
+            self._result_cache_usable, user_request, isolated=isolated
+        )
+
         result: dict[str, Any] = {
             "success": False,
             "menu": None,
@@ -321,137 +842,86 @@ class ChristmasMenuOrchestrator:
             "provider": self.get_provider_info(),
         }
 
-        # Step 1: Extract preferences
-        preferences_result = self.info_checker.extract_preferences(user_request)
-        result["agent_outputs"]["info_checker"] = preferences_result
-
-        if not preferences_result.get("is_complete"):
-            preferences = preferences_result.get("preferences") or {
-                "number_of_guests": 6,
-                "has_vegetarians": False,
-                "vegetarian_count": 0,
-                "has_vegans": False,
-                "vegan_count": 0,
-                "allergies": [],
-                "custom_allergies": [],
-                "prefer_traditional": True,
-                "max_difficulty": "medium",
-            }
-        else:
-            preferences = preferences_result.get("preferences", {})
-
-        result["preferences"] = preferences
-
-        # Step 2: Search recipes (could run in parallel with asyncio.gather if agents support async)
-        result["agent_outputs"]["appetizer"] = self.appetizer_agent.search(preferences)
-        result["agent_outputs"]["main_dish"] = self.main_dish_agent.search(preferences)
-        result["agent_outputs"]["second_plate"] = self.second_plate_agent.search(
-            preferences
+        events = self._run_async_core(
+            user_request, stream_menu=False, isolated=isolated
         )
-        result["agent_outputs"]["dessert"] = self.dessert_agent.search(preferences)
-
-        # Step 3: Create menu
-        menu_result = self.menu_creator.create_menu(
-            preferences=preferences,
-            appetizer_suggestions=result["agent_outputs"]["appetizer"].get(
-                "raw_response", ""
-            ),
-            main_dish_suggestions=result["agent_outputs"]["main_dish"].get(
-                "raw_response", ""
-            ),
-            second_plate_suggestions=result["agent_outputs"]["second_plate"].get(
-                "raw_response", ""
-            ),
-            dessert_suggestions=result["agent_outputs"]["dessert"].get(
-                "raw_response", ""
-            ),
-        )
-
-        result["agent_outputs"]["menu_creator"] = menu_result
-        result["menu"] = menu_result.get("formatted_menu", "")
-        result["success"] = True
-
+        try:
+            async for event in events:
+                if event["type"] == "progress":
+                    if event["step"] == "info_checker":
+                        result["agent_outputs"]["info_checker"] = event["output"]
+                        result["preferences"] = event["data"]
+                        if use_result_cache:
+                            cached = await asyncio.to_thread(
+                                self._cached_result, user_request, event["data"]
+                            )
+                            if cached is not None:
+                                return cached
+                    else:
+                        result["agent_outputs"][event["step"]] = event["data"]
+                elif event["type"] == "complete":
+                    result["agent_outputs"]["menu_creator"] = event["output"]
+                    result["menu"] = event["menu"]
+                    result["success"] = True
+        finally:
+            await events.aclose()
+
+        if use_result_cache:
+            await asyncio.to_thread(self._store_result, user_request, result)
         return result
 
     async def run_async_streaming(
-        self, user_request: str
+        self, user_request: str | dict[str, Any]
     ) -> AsyncGenerator[dict[str, Any], None]:
         """
-        Run the pipeline with async streaming using a_stream_invoke().
+        Run the pipeline with async streaming of the menu creation.
 
         Args:
-            user_request: The user's request for a Christmas menu
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
 
         Yields:
             Progress updates at each step
         """
-        yield {
-            "type": "status",
-            "message": f"🎄 Starting Christmas Menu Planner (Async - {self.get_provider_info()})...",
-        }
-
-        # Step 1: Extract preferences
-        yield {"type": "status", "message": "📋 Analyzing your requirements..."}
-        preferences_result = self.info_checker.extract_preferences(user_request)
-
-        if not preferences_result.get("is_complete"):
-            preferences = preferences_result.get("preferences") or {
-                "number_of_guests": 6,
-                "has_vegetarians": False,
-                "vegetarian_count": 0,
-                "has_vegans": False,
-                "vegan_count": 0,
-                "allergies": [],
-                "custom_allergies": [],
-                "prefer_traditional": True,
-                "max_difficulty": "medium",
-            }
-        else:
-            preferences = preferences_result.get("preferences", {})
-
-        yield {
-            "type": "progress",
-            "step": "info_checker",
-            "message": "✅ Preferences extracted",
-            "data": preferences,
-        }
+        events = self._run_async_core(user_request)
+        try:
+            async for event in events:
+                yield event
+        finally:
+            await events.aclose()
+
+    async def run_batch_async(
+        self, user_requests: list[str | dict[str, Any]], max_concurrency: int = 4
+    ) -> list[dict[str, Any]]:
+        """
+        Run the pipeline for several independent requests concurrently.
+        Each request is treated as a new conversation with the info checker.
 
-        # Step 2: Search recipes
-        recipe_results = {}
-        for category, agent in [
-            ("appetizer", self.appetizer_agent),
-            ("main_dish", self.main_dish_agent),
-            ("second_plate", self.second_plate_agent),
-            ("dessert", self.dessert_agent),
-        ]:
-            yield {
-                "type": "status",
-                "message": f"🔍 Searching {category.replace('_', ' ')}...",
-            }
-            result = agent.search(preferences)
-            recipe_results[category] = result
-            yield {"type": "progress", "step": category, "data": result}
+        Args:
+            user_requests: Requests for a Christmas menu, or preferences dicts
+            max_concurrency: Maximum number of pipelines in flight at once
 
-        # Step 3: Create menu with async streaming
-        yield {"type": "status", "message": "📝 Creating menu..."}
+        Returns:
+            One result per request (same as run()), in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        final_menu = None
-        async for step in self.menu_creator.a_stream_invoke(
-            f"Create Christmas menu for {preferences.get('number_of_guests', 6)} guests"
-        ):
-            step_text = step.text if hasattr(step, "text") else str(step)
-            yield {"type": "step", "message": step_text}
-            final_menu = step_text
+        async def run_one(user_request: str | dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._run_async_result(user_request, isolated=True)
 
-        yield {"type": "complete", "menu": final_menu, "preferences": preferences}
+        return list(await asyncio.gather(*map(run_one, user_requests)))
 
-    def run_with_native_agents(self, user_request: str) -> dict[str, Any]:
+    def run_with_native_agents(
+        self, user_request: str | dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Run the pipeline using native can_call() multi-agent collaboration.
         The menu creator directly calls recipe agents as tools.
 
         Args:
-            user_request: The user's request for a Christmas menu
+            user_request: The user's request for a Christmas menu, or a
+                preferences dict that skips the info checker
 
         Returns:
             Dictionary with menu and metadata
@@ -463,28 +933,16 @@ class ChristmasMenuOrchestrator:
 
         # Step 1: Extract preferences
         logger.info("\n📋 Step 1: Analyzing your requirements...")
-        preferences_result = self.info_checker.extract_preferences(user_request)
+        preferences_result = self._extract_preferences(user_request)
 
-        if not preferences_result.get("is_complete"):
-            preferences = preferences_result.get("preferences") or {
-                "number_of_guests": 6,
-                "has_vegetarians": False,
-                "vegetarian_count": 0,
-                "has_vegans": False,
-                "vegan_count": 0,
-                "allergies": [],
-                "custom_allergies": [],
-                "prefer_traditional": True,
-                "max_difficulty": "medium",
-            }
-        else:
-            preferences = preferences_result.get("preferences", {})
+        preferences = self._resolve_preferences(preferences_result)
 
         logger.info(
             f"✅ Preferences: {preferences.get('number_of_guests', 'N/A')} guests"
         )
 
         # Step 2: Let menu creator handle everything via can_call()
+        self._ensure_db()
         logger.info("\n🤖 Step 2: Menu Creator coordinating with recipe experts...")
         menu_result = self.menu_creator.create_menu_with_agents(preferences)
 
@@ -513,25 +971,31 @@ class ChristmasMenuOrchestrator:
 
     def get_recipe_count(self) -> int:
         """Get the number of recipes in the database."""
+        self._ensure_db()
         return self.vector_store.count_recipes()
 
-    def reload_recipes(self, json_file: str | None = None) -> int:
+    def reload_recipes(
+        self, json_file: str | None = None, incremental: bool = False
+    ) -> int:
         """
         Reload recipes into the database.
 
         Args:
             json_file: Path to JSON file with recipes. Uses sample recipes if None.
+            incremental: Only re-embed new or changed recipes instead of clearing the store
 
         Returns:
             Number of recipes loaded
         """
-        self.vector_store.clear_all()
+        self._ensure_db()
+        if not incremental:
+            self.vector_store.clear_all()
         loader = RecipeLoader(self.vector_store)
 
         if json_file:
-            return loader.load_from_json_file(json_file)
+            return loader.load_from_json_file(json_file, incremental=incremental)
         else:
-            return loader.load_sample_recipes()
+            return loader.load_sample_recipes(incremental=incremental)
 
     def clear_info_checker_memory(self) -> None:
         """Clear the info checker's conversation memory."""
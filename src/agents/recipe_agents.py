@@ -1,8 +1,16 @@
-from typing import Any
+import threading
+from collections.abc import Generator
+from functools import lru_cache
+from typing import Any, ClassVar
 from datapizza.agents import Agent  # type: ignore
 
-from ..config import create_client
+from ..config import create_client, get_shared_client
+from ..models.course_suggestions import CourseSuggestions
+from ..models.user_preferences import as_allergy_list
+from ..models.recipe import RecipeCategory
 from ..tools.recipe_search import (
+    _format_recipes_for_agent,
+    get_vector_store,
     search_appetizers,
     search_main_dishes,
     search_second_plates,
@@ -18,6 +26,61 @@ TRADITIONAL_DISHES: dict[str, Any] = {
     "dessert": [],
 }  # TODO: ask directly the agent to see if they are traditional
 
+_TRADITIONAL_TEXT: dict[str, str] = {
+    category: f"Traditional options: {', '.join(options)}" if options else ""
+    for category, options in TRADITIONAL_DISHES.items()
+}
+
+_PROMPT_TEMPLATE = """
+You are an expert Christmas %(course)s specialist. Your role is to:
+
+1. Search for %(course)s recipes that match the user's preferences
+2. Consider dietary restrictions (vegan, vegetarian, allergies)
+3. Recommend %(count)s %(course)s options
+4. Prefer traditional recipes when requested
+5. Provide brief explanations for each recommendation
+
+%(traditional)s
+
+%(guests)s
+
+%(context)s
+
+Please search for %(course)s and recommend %(count)s options.
+Ensure vegan/vegetarian options are included if needed.
+"""
+
+
+# Vector store filters that keep an allergen out of every candidate recipe
+_ALLERGEN_FILTERS = {
+    "gluten": "is_gluten_free",
+    "wheat": "is_gluten_free",
+    "nuts": "is_nut_free",
+    "peanuts": "is_nut_free",
+    "dairy": "is_dairy_free",
+}
+
+_AGENT_POOL: dict[tuple, "BaseRecipeAgent"] = {}
+_AGENT_POOL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=128)
+def _guest_block(
+    number_of_guests: Any,
+    vegan_guests: Any,
+    vegetarian_guests: Any,
+    allergens: tuple[str, ...],
+    prefer_traditional: bool,
+) -> str:
+    """Render the guest profile once; all four course agents send the same text."""
+    return (
+        f"Number of guests: {number_of_guests}\n"
+        f"Vegan guests: {vegan_guests}\n"
+        f"Vegetarian guests: {vegetarian_guests}\n"
+        f"Allergies to avoid: {', '.join(allergens) if allergens else 'None'}\n"
+        f"Prefer traditional recipes: {'Yes' if prefer_traditional else 'No'}"
+    )
+
 
 class BaseRecipeAgent(Agent):
     """
@@ -41,7 +104,7 @@ class BaseRecipeAgent(Agent):
             api_key: OpenAI API key (not needed for Ollama)
             provider: LLM provider override ("openai" or "ollama")
         """
-        client = create_client(
+        client = get_shared_client(
             api_key=api_key,
             system_prompt=self.SYSTEM_PROMPT,
             temperature=0.7,
@@ -58,73 +121,84 @@ class BaseRecipeAgent(Agent):
             **kwargs,
         )
 
+    @classmethod
+    def get_instance(
+        cls, api_key: str | None = None, provider: str | None = None
+    ) -> "BaseRecipeAgent":
+        """
+        Get the pooled agent for this configuration, creating it on first use.
+        Recipe agents are stateless between runs, so orchestrators can share them.
+
+        Args:
+            api_key: OpenAI API key (not needed for Ollama)
+            provider: LLM provider override ("openai" or "ollama")
+
+        Returns:
+            Shared agent instance
+        """
+        key = (cls, api_key, provider)
+        with _AGENT_POOL_LOCK:
+            agent = _AGENT_POOL.get(key)
+            if agent is None:
+                agent = _AGENT_POOL[key] = cls(api_key=api_key, provider=provider)
+        return agent
+
     def _get_tools(self) -> list:
         """Get the tools for this agent."""
         return self.TOOLS
 
     def _extract_preferences(self, preferences: dict[str, Any]) -> dict[str, Any]:
-        allergies = preferences.get("allergies", [])
-        custom_allergies = preferences.get("custom_allergies", [])
-        if isinstance(allergies, str):
-            if not isinstance(custom_allergies, str):
-                if isinstance(custom_allergies, list):
-                    custom_allergies = ', '.join(custom_allergies)
-                else: 
-                    custom_allergies = ""
-        elif isinstance(allergies, list):
-            if not isinstance(custom_allergies, list):
-                if isinstance(custom_allergies, str):
-                    custom_allergies = [custom_allergies]
-                else: 
-                    custom_allergies = []
+        allergens = as_allergy_list(preferences.get("allergies")) + as_allergy_list(
+            preferences.get("custom_allergies")
+        )
 
         return {
             "has_vegans": preferences.get("has_vegans", False),
             "has_vegetarians": preferences.get("has_vegetarians", False),
             "prefer_traditional": preferences.get("prefer_traditional", True),
-            "allergens": allergies + custom_allergies,
+            "allergens": allergens,
             "number_of_guests": preferences.get("number_of_guests", "unknown"),
             "vegan_count": preferences.get("vegan_count", 0),
             "vegetarian_count": preferences.get("vegetarian_count", 0),
         }
 
-    def _build_prompt(self, prefs: dict[str, Any], context: str = "") -> str:
-        traditional_options = TRADITIONAL_DISHES.get(self.CATEGORY, [])
-        traditional_text = (
-            f"Traditional options: {', '.join(traditional_options)}"
-            if traditional_options
-            else ""
+    def _guest_profile(self, prefs: dict[str, Any]) -> str:
+        return _guest_block(
+            prefs["number_of_guests"],
+            prefs["vegan_count"] if prefs["has_vegans"] else "None",
+            prefs["vegetarian_count"] if prefs["has_vegetarians"] else "None",
+            tuple(prefs["allergens"]),
+            bool(prefs["prefer_traditional"]),
         )
-        return f"""
-You are an expert Christmas {self.COURSE_NAME} specialist. Your role is to:
-
-1. Search for {self.COURSE_NAME} recipes that match the user's preferences
-2. Consider dietary restrictions (vegan, vegetarian, allergies)
-3. Recommend {self.RECOMMENDED_COUNT} {self.COURSE_NAME} options
-4. Prefer traditional recipes when requested
-5. Provide brief explanations for each recommendation
 
-{traditional_text}
-
-Number of guests: {prefs["number_of_guests"]}
-Vegan guests: {prefs["vegan_count"] if prefs["has_vegans"] else "None"}
-Vegetarian guests: {prefs["vegetarian_count"] if prefs["has_vegetarians"] else "None"}
-Allergies to avoid: {", ".join(prefs["allergens"]) if prefs["allergens"] else "None"}
-Prefer traditional recipes: {"Yes" if prefs["prefer_traditional"] else "No"}
+    def _build_prompt(self, prefs: dict[str, Any], context: str = "") -> str:
+        return _PROMPT_TEMPLATE % {
+            "course": self.COURSE_NAME,
+            "count": self.RECOMMENDED_COUNT,
+            "traditional": _TRADITIONAL_TEXT.get(self.CATEGORY, ""),
+            "guests": self._guest_profile(prefs),
+            "context": f"Additional context: {context}" if context else "",
+        }
 
-{f"Additional context: {context}" if context else ""}
+    def search(self, preferences: dict[str, Any], context: str = "") -> dict[str, Any]:
+        """
+        Search recipes for this course.
 
-Please search for {self.COURSE_NAME} and recommend {self.RECOMMENDED_COUNT} options.
-Ensure vegan/vegetarian options are included if needed.
-"""
+        Args:
+            preferences: User preferences dictionary
+            context: Optional additional context for the search
 
-    def search(self, preferences: dict[str, Any], context: str = "") -> dict[str, Any]:
+        Returns:
+            Dictionary with the category, raw response and preferences used
+        """
         prefs = self._extract_preferences(preferences)
         prompt = self._build_prompt(prefs, context)
         response = self.run(prompt, tool_choice="required_first")
+        raw_response = response.text if response.text is not None else str(response)
+
         return {
             "category": self.CATEGORY,
-            "raw_response": getattr(response, "text", str(response)),
+            "raw_response": raw_response,
             "preferences_used": prefs,
         }
 
@@ -229,6 +303,109 @@ Output your recommendations with brief explanations for why each was chosen.
 Format your response clearly with the recipe names, descriptions, and why they were selected."""
 
 
+class AllCoursesAgent(BaseRecipeAgent):
+    """
+    Agent that suggests every course with a single structured LLM call.
+    Candidates come from one batched vector search instead of per-course tool calls.
+    """
+
+    CATEGORY = "all_courses"
+    COURSE_NAME = "course"
+    TOOLS: ClassVar[list] = []
+    CANDIDATES_PER_COURSE = 5
+    SYSTEM_PROMPT = """You are an expert Christmas menu researcher. Your role is to:
+
+1. Recommend dishes for every course: appetizer, main dish, second plate and dessert
+2. Choose only from the candidate recipes you are given for each course
+3. Consider dietary restrictions (vegan, vegetarian, allergies)
+4. Prefer traditional Christmas recipes when requested
+
+For each course, give the recipe names, descriptions, and why they were selected.
+If vegan or vegetarian guests are present, include at least one suitable option per course."""
+
+    def _find_candidates(
+        self, prefs: dict[str, Any], courses: list[RecipeCategory]
+    ) -> list[list[Any]]:
+        """
+        Find candidate recipes for each course with the guests' dietary filters.
+        Allergens are excluded from every candidate. When some guests are vegan or
+        vegetarian, matching recipes are searched separately and listed first, so
+        each course offers suitable options without dropping the others.
+        """
+        store = get_vector_store()
+        queries = [
+            (f"Christmas {course.value.replace('_', ' ')}", course)
+            for course in courses
+        ]
+        filters: dict[str, Any] = {
+            "n_results": self.CANDIDATES_PER_COURSE,
+            "prefer_traditional": bool(prefs["prefer_traditional"]),
+        }
+        for allergen in prefs["allergens"]:
+            flag = _ALLERGEN_FILTERS.get(str(allergen).strip().lower())
+            if flag:
+                filters[flag] = True
+
+        candidates = store.search_recipes_many(queries, **filters)
+
+        if prefs["has_vegans"]:
+            diet_filter = {"is_vegan": True}
+        elif prefs["has_vegetarians"]:
+            diet_filter = {"is_vegetarian": True}
+        else:
+            return candidates
+
+        suitable = store.search_recipes_many(queries, **filters, **diet_filter)
+        merged = []
+        for diet_recipes, recipes in zip(suitable, candidates):
+            names = {recipe.name for recipe in diet_recipes}
+            merged.append(
+                diet_recipes
+                + [recipe for recipe in recipes if recipe.name not in names]
+            )
+        return merged
+
+    def search_all(self, preferences: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """
+        Search recipes for every course at once.
+
+        Args:
+            preferences: User preferences dictionary
+
+        Returns:
+            Search result for each course, shaped like BaseRecipeAgent.search()
+        """
+        prefs = self._extract_preferences(preferences)
+        courses = list(RecipeCategory)
+        candidates = self._find_candidates(prefs, courses)
+
+        sections = "\n\n".join(
+            f"## {course.value.replace('_', ' ').title()} candidates\n"
+            f"{_format_recipes_for_agent(recipes)}"
+            for course, recipes in zip(courses, candidates)
+        )
+        guest_block = self._guest_profile(prefs)
+        prompt = f"""{guest_block}
+
+Recommend {self.RECOMMENDED_COUNT} options for each course from these candidates:
+
+{sections}
+"""
+        response = self._client.structured_response(
+            input=prompt, output_cls=CourseSuggestions
+        )
+        suggestions = response.structured_data[0]
+
+        return {
+            course.value: {
+                "category": course.value,
+                "raw_response": getattr(suggestions, course.value),
+                "preferences_used": prefs,
+            }
+            for course in courses
+        }
+
+
 class RecipeResearchAgent(Agent):
     """Agent for discovering new recipes from the web using DuckDuckGo search."""
 
@@ -271,8 +448,22 @@ Output clear recipe suggestions with names, brief descriptions, and source URLs.
             tools=[DuckDuckGoSearchTool()],
             max_steps=5,
             terminate_on_text=True,
+            stream=True,
         )
 
+    @staticmethod
+    def _web_search_prompt(query: str, dietary_requirements: str = "") -> str:
+        return f"""
+Search for Christmas recipes matching: {query}
+{f"Dietary requirements: {dietary_requirements}" if dietary_requirements else ""}
+
+Find 2-3 suitable recipes and provide:
+- Recipe name
+- Brief description
+- Key ingredients
+- Why it's a good choice
+"""
+
     def search_web_recipes(self, query: str, dietary_requirements: str = "") -> str:
         """
         Search the web for recipes matching the query.
@@ -284,15 +475,38 @@ Output clear recipe suggestions with names, brief descriptions, and source URLs.
         Returns:
             Search results with recipe suggestions
         """
-        search_prompt = f"""
-Search for Christmas recipes matching: {query}
-{f"Dietary requirements: {dietary_requirements}" if dietary_requirements else ""}
-
-Find 2-3 suitable recipes and provide:
-- Recipe name
-- Brief description
-- Key ingredients
-- Why it's a good choice
-"""
+        search_prompt = self._web_search_prompt(query, dietary_requirements)
         response = self.run(search_prompt, tool_choice="required_first")
-        return response.text if hasattr(response, "text") else str(response)
+        text = getattr(response, "text", None)
+        return text if text is not None else str(response)
+
+    def stream_web_recipes(
+        self, query: str, dietary_requirements: str = ""
+    ) -> Generator[str, None, None]:
+        """
+        Search the web for recipes, yielding the answer text as it is generated.
+
+        Args:
+            query: Recipe search query
+            dietary_requirements: Optional dietary requirements to include
+
+        Yields:
+            Text chunks of the search results
+        """
+        search_prompt = self._web_search_prompt(query, dietary_requirements)
+        streamed = False
+        for step in self.stream_invoke(search_prompt, tool_choice="required_first"):
+            delta = getattr(step, "delta", None)
+            if isinstance(delta, str):
+                # Token chunk of the step currently being generated
+                streamed = streamed or bool(delta)
+                if delta:
+                    yield delta
+                continue
+
+            text = getattr(step, "text", None)
+            if isinstance(text, str):
+                # Completed step: only emit its text if it was not streamed already
+                if text and not streamed:
+                    yield text
+                streamed = False
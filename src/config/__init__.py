@@ -2,6 +2,7 @@ from .settings import settings, Settings
 from .client_factory import (
     create_client,
     get_model_name,
+    get_shared_client,
     get_provider_name,
     test_connection,
 )
@@ -11,6 +12,7 @@ __all__ = [
     "Settings",
     "create_client",
     "get_model_name",
+    "get_shared_client",
     "get_provider_name",
     "test_connection",
 ]
@@ -1,7 +1,16 @@
-from datapizza.clients.openai import OpenAIClient  # type: ignore
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from .settings import settings
+from .settings import LLMProvider, settings
+
+if TYPE_CHECKING:
+    import httpx
+    from datapizza.clients.openai import OpenAIClient  # type: ignore
+
+_http_client: "httpx.Client | None" = None
+_http_client_lock = threading.Lock()
 
 
 def create_client(
@@ -10,8 +19,11 @@ def create_client(
     system_prompt: str | None = None,
     temperature: float | None = None,
     provider: str | None = None,
-) -> OpenAIClient:
-    use_ollama = (provider or settings.LLM_PROVIDER.value).lower() == "ollama"
+) -> "OpenAIClient":
+    if provider is None:
+        use_ollama = settings.is_ollama()
+    else:
+        use_ollama = provider is LLMProvider.OLLAMA or provider.lower() == "ollama"
 
     if use_ollama:
         # TODO: create Ollama client class
@@ -25,18 +37,63 @@ def create_client(
     )
 
 
+@lru_cache(maxsize=32)
+def get_shared_client(
+    api_key: str | None = None,
+    model: str | None = None,
+    system_prompt: str | None = None,
+    temperature: float | None = None,
+    provider: str | None = None,
+) -> "OpenAIClient":
+    """Return one client per configuration, so agents built repeatedly reuse it"""
+    return create_client(
+        api_key=api_key,
+        model=model,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        provider=provider,
+    )
+
+
+def _get_http_client() -> "httpx.Client":
+    """Connection pool shared by every OpenAI client, so agents reuse keep-alive connections"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            from openai import DefaultHttpxClient
+
+            try:
+                import h2  # type: ignore # noqa: F401
+
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            import httpx
+
+            _http_client = DefaultHttpxClient(
+                http2=http2,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return _http_client
+
+
 def _create_openai_client(
     api_key: str | None = None,
     model: str | None = None,
     system_prompt: str | None = None,
     temperature: float | None = None,
-) -> OpenAIClient:
+) -> "OpenAIClient":
     """Create OpenAI client"""
+    # Imported lazily: the openai SDK dominates import time for callers that only need settings
+    from datapizza.clients.openai import OpenAIClient  # type: ignore
+
     return OpenAIClient(
         api_key=api_key or settings.OPENAI_API_KEY,
         model=model or settings.DEFAULT_MODEL,
         system_prompt=system_prompt,
         temperature=temperature or settings.TEMPERATURE,
+        http_client=_get_http_client(),
     )
 
 
@@ -52,8 +109,9 @@ def get_model_name() -> str:
 
 def test_connection() -> bool:
     try:
-        client = create_client()
+        client = get_shared_client()
         response = client.invoke("Say 'Christmas', just one word.")
     except Exception as e:
         logger.exception(f"Connection test failed: {e}")
+        return False
     return response is not None
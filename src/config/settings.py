@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass, field
 from enum import Enum
 from dotenv import load_dotenv
 
@@ -10,10 +11,13 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings."""
 
-    LLM_PROVIDER = LLMProvider(os.getenv("LLM_PROVIDER", "openai"))
+    LLM_PROVIDER: LLMProvider = field(
+        default_factory=lambda: LLMProvider(os.getenv("LLM_PROVIDER", "openai"))
+    )
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     DEFAULT_MODEL: str = os.getenv("DEFAULT_MODEL", "gpt-4o-mini")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
@@ -30,32 +34,76 @@ class Settings:
     QDRANT_LOCATION: str = os.getenv("QDRANT_LOCATION", ":memory:")
     COLLECTION_NAME: str = os.getenv("COLLECTION_NAME", "christmas_recipes")
 
-    RECIPE_CATEGORIES = ["appetizer", "main_dish", "second_plate", "dessert"]
-    DIETARY_OPTIONS = ["vegan", "vegetarian", "gluten_free", "diary_free", "nut_free"]
-
-    @classmethod
-    def is_ollama(cls) -> bool:
+    EXTRACTION_CACHE_ENABLED: bool = (
+        os.getenv("EXTRACTION_CACHE_ENABLED", "false").lower() == "true"
+    )
+    EXTRACTION_CACHE_PATH: str = os.getenv(
+        "EXTRACTION_CACHE_PATH", "data/extraction_cache.db"
+    )
+    EXTRACTION_CACHE_SEMANTIC: bool = (
+        os.getenv("EXTRACTION_CACHE_SEMANTIC", "false").lower() == "true"
+    )
+    EXTRACTION_CACHE_SIMILARITY: float = float(
+        os.getenv("EXTRACTION_CACHE_SIMILARITY", "0.97")
+    )
+
+    RESPONSE_CACHE_ENABLED: bool = (
+        os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    )
+    RESPONSE_CACHE_PATH: str = os.getenv(
+        "RESPONSE_CACHE_PATH", "data/response_cache.db"
+    )
+
+    SEMANTIC_CACHE_ENABLED: bool = (
+        os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    )
+    SEMANTIC_CACHE_PATH: str = os.getenv(
+        "SEMANTIC_CACHE_PATH", "data/semantic_cache.db"
+    )
+    SEMANTIC_CACHE_THRESHOLD: float = float(
+        os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")
+    )
+
+    BATCH_SEARCH: bool = os.getenv("BATCH_SEARCH", "false").lower() == "true"
+
+    RECIPE_CATEGORIES: list[str] = field(
+        default_factory=lambda: ["appetizer", "main_dish", "second_plate", "dessert"]
+    )
+    DIETARY_OPTIONS: list[str] = field(
+        default_factory=lambda: [
+            "vegan",
+            "vegetarian",
+            "gluten_free",
+            "diary_free",
+            "nut_free",
+        ]
+    )
+
+    # Resolved once: every agent construction asks which provider is active
+    _IS_OLLAMA: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_IS_OLLAMA", self.LLM_PROVIDER is LLMProvider.OLLAMA)
+
+    def is_ollama(self) -> bool:
         "Check if provider is Ollama"
-        return cls.LLM_PROVIDER.value.lower() == "ollama"
+        return self._IS_OLLAMA
 
-    @classmethod
-    def is_openai(cls) -> bool:
+    def is_openai(self) -> bool:
         "Check if provider is OpenAI"
-        return cls.LLM_PROVIDER.value.lower() == "openai"
+        return not self._IS_OLLAMA
 
-    @classmethod
-    def get_model(cls) -> str:
+    def get_model(self) -> str:
         "Get configured model based on the provider"
-        if cls.is_ollama():
-            return cls.OLLAMA_MODEL
-        return cls.DEFAULT_MODEL
+        if self._IS_OLLAMA:
+            return self.OLLAMA_MODEL
+        return self.DEFAULT_MODEL
 
-    @classmethod
-    def get_provider_info(cls) -> str:
+    def get_provider_info(self) -> str:
         "Get provider general info"
-        if cls.is_ollama():
-            return f"Ollama ({cls.OLLAMA_MODEL}) at {cls.OLLAMA_BASE_URL}"
-        return f"OpenAI ({cls.DEFAULT_MODEL})"
+        if self._IS_OLLAMA:
+            return f"Ollama ({self.OLLAMA_MODEL}) at {self.OLLAMA_BASE_URL}"
+        return f"OpenAI ({self.DEFAULT_MODEL})"
 
 
 settings = Settings()
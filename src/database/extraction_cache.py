@@ -0,0 +1,176 @@
+"""
+Extraction Cache - Persists recipes extracted from document text.
+
+Avoids paying a full LLM round-trip for documents that were already parsed.
+Lookups go through two tiers:
+- exact: SHA-256 of the cache namespace (e.g. the system prompt) and the text
+- semantic: cosine similarity between text embeddings (only if an embedder is set)
+"""
+
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from openai import OpenAIError
+
+from ..config.settings import settings
+
+# Failures of the (OpenAI) embedder that only disable the semantic tier
+_EMBEDDING_ERRORS = (OpenAIError, OSError, ValueError)
+
+
+class ExtractionCache:
+    """
+    SQLite-backed cache of `list[dict]` extraction results.
+    Survives across runs so re-ingesting the same PDFs is free.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        namespace: str = "",
+        embedder: Any | None = None,
+        similarity_threshold: float | None = None,
+    ):
+        """
+        Initialize the extraction cache.
+
+        Args:
+            path: SQLite file path (":memory:" for a volatile cache). Uses settings default if None.
+            namespace: Prefix mixed into every key, so a prompt change invalidates old entries.
+            embedder: Optional embedder with an `embed(text)` method to enable semantic lookups.
+            similarity_threshold: Minimum cosine similarity for a semantic hit. Uses settings default if None.
+        """
+        path = path or settings.EXTRACTION_CACHE_PATH
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.namespace = namespace
+        self.embedder = embedder
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else settings.EXTRACTION_CACHE_SIMILARITY
+        )
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions ("
+            "key TEXT PRIMARY KEY, recipes TEXT NOT NULL, embedding TEXT)"
+        )
+        self._conn.commit()
+
+        self._vectors: list[tuple[list[float], str]] | None = None
+        self._last_embedding: tuple[str, list[float]] | None = None
+
+    def _make_key(self, text: str) -> str:
+        """Build the exact-match key for a text."""
+        return hashlib.sha256((self.namespace + text).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        """Scale a vector to unit length so cosine similarity is a dot product."""
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    def _embed(self, key: str, text: str) -> list[float]:
+        """Embed a text, reusing the vector computed for the last missed lookup."""
+        if self._last_embedding and self._last_embedding[0] == key:
+            return self._last_embedding[1]
+        vector = self._normalize(self.embedder.embed(text))
+        self._last_embedding = (key, vector)
+        return vector
+
+    def _load_vectors(self) -> list[tuple[list[float], str]]:
+        """Load stored embeddings once for the semantic tier."""
+        if self._vectors is None:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM extractions WHERE embedding IS NOT NULL"
+            ).fetchall()
+            self._vectors = [(json.loads(embedding), key) for key, embedding in rows]
+        return self._vectors
+
+    def get(self, text: str) -> list[dict] | None:
+        """
+        Look up the extraction result for a text.
+
+        Args:
+            text: Document text that was sent for extraction
+
+        Returns:
+            Cached list of recipe dictionaries, or None on a miss
+        """
+        key = self._make_key(text)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT recipes FROM extractions WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None and self.embedder is not None:
+                    try:
+                        query = self._embed(key, text)
+                    except _EMBEDDING_ERRORS as e:
+                        print(f"Extraction cache embedding failed: {e}")
+                        return None
+
+                    best_key, best_score = None, self.similarity_threshold
+                    for vector, stored_key in self._load_vectors():
+                        score = sum(a * b for a, b in zip(query, vector))
+                        if score >= best_score:
+                            best_key, best_score = stored_key, score
+
+                    if best_key is not None:
+                        row = self._conn.execute(
+                            "SELECT recipes FROM extractions WHERE key = ?",
+                            (best_key,),
+                        ).fetchone()
+
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            print(f"Extraction cache lookup failed: {e}")
+            return None
+
+    def set(self, text: str, recipes: list[dict]) -> None:
+        """
+        Store the extraction result for a text.
+
+        Args:
+            text: Document text that was sent for extraction
+            recipes: Extracted recipe dictionaries
+        """
+        key = self._make_key(text)
+        with self._lock:
+            vector = None
+            if self.embedder is not None:
+                try:
+                    vector = self._embed(key, text)
+                except _EMBEDDING_ERRORS as e:
+                    print(f"Extraction cache embedding failed: {e}")
+
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extractions (key, recipes, embedding) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(recipes), json.dumps(vector) if vector else None),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Extraction cache write failed: {e}")
+                return
+
+            if vector is not None and self._vectors is not None:
+                self._vectors.append((vector, key))
+
+    def clear(self) -> None:
+        """Remove every cached extraction."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions")
+            self._conn.commit()
+            self._vectors = None
+            self._last_embedding = None
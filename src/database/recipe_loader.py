@@ -23,12 +23,13 @@ class RecipeLoader:
         """
         self.vector_store = vector_store or RecipeVectorStore()
 
-    def load_from_json_file(self, file_path: str) -> int:
+    def load_from_json_file(self, file_path: str, incremental: bool = False) -> int:
         """
         Load recipes from a JSON file.
 
         Args:
             file_path: Path to the JSON file
+            incremental: Only embed new or changed recipes and drop missing ones
 
         Returns:
             Number of recipes loaded
@@ -51,17 +52,22 @@ class RecipeLoader:
                 print(f"Error parsing recipe: {e}")
                 continue
 
-        if recipes:
+        if incremental:
+            self.vector_store.sync_recipes(recipes)
+        elif recipes:
             self.vector_store.add_recipes(recipes)
 
         return len(recipes)
 
-    def load_from_dict_list(self, recipes_data: list[dict]) -> int:
+    def load_from_dict_list(
+        self, recipes_data: list[dict], incremental: bool = False
+    ) -> int:
         """
         Load recipes from a list of dictionaries.
 
         Args:
             recipes_data: List of recipe dictionaries
+            incremental: Only embed new or changed recipes and drop missing ones
 
         Returns:
             Number of recipes loaded
@@ -75,15 +81,20 @@ class RecipeLoader:
                 print(f"Error parsing recipe: {e}")
                 continue
 
-        if recipes:
+        if incremental:
+            self.vector_store.sync_recipes(recipes)
+        elif recipes:
             self.vector_store.add_recipes(recipes)
 
         return len(recipes)
 
-    def load_sample_recipes(self) -> int:
+    def load_sample_recipes(self, incremental: bool = False) -> int:
         """
         Load sample Christmas recipes for testing.
 
+        Args:
+            incremental: Only embed new or changed recipes and drop missing ones
+
         Returns:
             Number of recipes loaded
         """
@@ -547,7 +558,7 @@ class RecipeLoader:
             },
         ]
 
-        return self.load_from_dict_list(sample_recipes)
+        return self.load_from_dict_list(sample_recipes, incremental=incremental)
 
     def load_from_pdf(
         self,
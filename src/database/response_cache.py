@@ -0,0 +1,97 @@
+"""
+Response Cache - Persists agent responses keyed by their inputs.
+
+Identical user requests and recipe searches are answered from disk instead of
+paying another LLM round-trip. Keys are the SHA-256 of the namespace and the
+canonical JSON of the inputs, so dict ordering does not matter.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import settings
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of JSON-serializable agent responses.
+    Safe to share between the orchestrator's worker threads.
+    """
+
+    def __init__(self, path: str | None = None, namespace: str = ""):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: SQLite file path (":memory:" for a volatile cache). Uses settings default if None.
+            namespace: Prefix mixed into every key, so a prompt change invalidates old entries.
+        """
+        path = path or settings.RESPONSE_CACHE_PATH
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _make_key(self, *parts: Any) -> str:
+        """Build the key for a set of inputs."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256((self.namespace + payload).encode("utf-8")).hexdigest()
+
+    def get(self, *parts: Any) -> Any | None:
+        """
+        Look up the cached response for a set of inputs.
+
+        Args:
+            parts: Inputs that identify the response (e.g. agent name and preferences)
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        try:
+            key = self._make_key(*parts)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Response cache lookup failed: {e}")
+            return None
+
+    def set(self, value: Any, *parts: Any) -> None:
+        """
+        Store the response for a set of inputs.
+
+        Args:
+            value: JSON-serializable response
+            parts: Inputs that identify the response
+        """
+        try:
+            key = self._make_key(*parts)
+            response = json.dumps(value, default=str)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, response),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Response cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
@@ -4,6 +4,8 @@ from datapizza.vectorstores.qdrant import QdrantVectorstore  # type: ignore
 from datapizza.core.vectorstore import VectorConfig, Distance  # type: ignore
 from datapizza.type import Chunk, DenseEmbedding  # type: ignore
 from datapizza.embedders.openai import OpenAIEmbedder  # type: ignore
+from pydantic import ValidationError
+from qdrant_client.http.exceptions import ApiException
 
 from ..config.settings import settings
 from ..models.recipe import Recipe, RecipeCategory, DietaryTag
@@ -249,6 +251,65 @@ class RecipeVectorStore:
             prefer_traditional=prefer_traditional,
         )
 
+        return self._search_by_vector(query_vector, search_filter, n_results)
+
+    def search_recipes_many(
+        self,
+        queries: list[tuple[str, RecipeCategory | None]],
+        n_results: int = 5,
+        is_vegan: bool | None = None,
+        is_vegetarian: bool | None = None,
+        is_gluten_free: bool | None = None,
+        is_dairy_free: bool | None = None,
+        is_nut_free: bool | None = None,
+        max_prep_time: int | None = None,
+        prefer_traditional: bool = False,
+    ) -> list[list[Recipe]]:
+        """
+        Run several searches that share the same dietary filters.
+        All queries are embedded with a single embedding request.
+
+        Args:
+            queries: (query text, category) pairs, e.g. one per course
+            n_results: Maximum number of results per query
+            is_vegan: Filter for vegan recipes
+            is_vegetarian: Filter for vegetarian recipes
+            is_gluten_free: Filter for gluten-free recipes
+            is_dairy_free: Filter for dairy-free recipes
+            is_nut_free: Filter for nut-free recipes
+            max_prep_time: Maximum preparation time in minutes
+            prefer_traditional: Prefer traditional Christmas recipes
+
+        Returns:
+            List of matching recipes for each query, in query order
+        """
+        if not queries:
+            return []
+
+        query_vectors = self.embedder.embed([query for query, _ in queries])
+
+        return [
+            self._search_by_vector(
+                query_vector,
+                self._build_filter(
+                    category=category,
+                    is_vegan=is_vegan,
+                    is_vegetarian=is_vegetarian,
+                    is_gluten_free=is_gluten_free,
+                    is_dairy_free=is_dairy_free,
+                    is_nut_free=is_nut_free,
+                    max_prep_time=max_prep_time,
+                    prefer_traditional=prefer_traditional,
+                ),
+                n_results,
+            )
+            for query_vector, (_, category) in zip(query_vectors, queries)
+        ]
+
+    def _search_by_vector(
+        self, query_vector: list[float], search_filter: dict | None, n_results: int
+    ) -> list[Recipe]:
+        """Search with an already computed embedding and parse the results."""
         try:
             results = self.vectorstore.search(
                 collection_name=self.collection_name,
@@ -256,7 +317,7 @@ class RecipeVectorStore:
                 k=n_results,
                 filter=search_filter,
             )
-        except Exception as e:
+        except (ValueError, ApiException) as e:
             print(f"Search error: {e}")
             results = self.vectorstore.search(
                 collection_name=self.collection_name,
@@ -271,7 +332,7 @@ class RecipeVectorStore:
                 if recipe_json:
                     recipe = Recipe.model_validate_json(recipe_json)
                     recipes.append(recipe)
-            except Exception as e:
+            except ValidationError as e:
                 print(f"Error parsing recipe: {e}")
                 continue
 
@@ -348,6 +409,39 @@ class RecipeVectorStore:
         except Exception:
             return 0
 
+    def sync_recipes(self, recipes: list[Recipe]) -> int:
+        """
+        Make the store hold exactly the given recipes.
+        Only new or changed recipes are embedded; recipes no longer listed are removed.
+
+        Args:
+            recipes: Full list of recipes the store should contain
+
+        Returns:
+            Number of recipes that had to be embedded
+        """
+        stored = {
+            chunk.id: chunk.metadata.get("recipe_json")
+            for chunk in self.vectorstore.dump_collection(
+                collection_name=self.collection_name,
+                with_vectors=False,
+            )
+            if chunk.id
+        }
+
+        changed = [
+            recipe
+            for recipe in recipes
+            if stored.get(recipe.id) != recipe.model_dump_json()
+        ]
+        removed = list(stored.keys() - {recipe.id for recipe in recipes})
+
+        if removed:
+            self.vectorstore.remove(collection_name=self.collection_name, ids=removed)
+        self.add_recipes(changed)
+
+        return len(changed)
+
     def clear_all(self) -> None:
         """Clear all recipes from the store."""
         try:
@@ -1,6 +1,13 @@
 from .recipe import Recipe, RecipeCategory, DietaryTag
 from .menu import Menu, MenuSection
 from .user_preferences import UserPreferences, Allergy
+from .extracted_recipe import (
+    ExtractedRecipe,
+    RecipeList,
+    DocumentRecipes,
+    BatchRecipeList,
+)
+from .course_suggestions import CourseSuggestions
 
 
 __all__ = [
@@ -11,4 +18,9 @@ __all__ = [
     "MenuSection",
     "UserPreferences",
     "Allergy",
+    "ExtractedRecipe",
+    "RecipeList",
+    "DocumentRecipes",
+    "BatchRecipeList",
+    "CourseSuggestions",
 ]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class CourseSuggestions(BaseModel):
+    """Recommendations for every course, returned by one batched search."""
+
+    appetizer: str = Field(description="Recommended appetizers with brief explanations")
+    main_dish: str = Field(
+        description="Recommended main dishes with brief explanations"
+    )
+    second_plate: str = Field(
+        description="Recommended second plates with brief explanations"
+    )
+    dessert: str = Field(description="Recommended desserts with brief explanations")
@@ -0,0 +1,39 @@
+from pydantic import BaseModel, Field
+
+
+class ExtractedRecipe(BaseModel):
+    """Pydantic model for extracted recipe data."""
+
+    name: str
+    description: str
+    category: str = Field(
+        description="One of: appetizer, main_dish, second_plate, dessert"
+    )
+    ingredients: list[str] = Field(default_factory=list)
+    instructions: list[str] = Field(default_factory=list)
+    servings: int = Field(default=4)
+    prep_time_minutes: int | None = None
+    cook_time_minutes: int | None = None
+    dietary_tags: list[str] = Field(default_factory=list)
+    allergens: list[str] = Field(default_factory=list)
+    difficulty: str = Field(default="medium", description="One of: easy, medium, hard")
+    is_christmas_traditional: bool = Field(default=True)
+
+
+class RecipeList(BaseModel):
+    """Wrapper model for a list of recipes."""
+
+    recipes: list[ExtractedRecipe]
+
+
+class DocumentRecipes(BaseModel):
+    """Recipes extracted from a single document of a batch."""
+
+    doc_index: int
+    recipes: list[ExtractedRecipe] = Field(default_factory=list)
+
+
+class BatchRecipeList(BaseModel):
+    """Wrapper model for the per-document results of a batch extraction."""
+
+    documents: list[DocumentRecipes]
@@ -1,4 +1,7 @@
 from enum import Enum
+from functools import cached_property
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -17,6 +20,15 @@ class Allergy(str, Enum):
     SOY = "soy"
 
 
+def as_allergy_list(value: Any) -> list[str]:
+    """Normalize an allergy field (list, comma-separated string or None) to a list."""
+    if type(value) is list:
+        return value
+    if type(value) is str:
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return []
+
+
 class UserPreferences(BaseModel):
     """Model representing user preferences for Christmas menu."""
 
@@ -33,8 +45,9 @@ class UserPreferences(BaseModel):
     max_cook_time_minutes: int | None = Field(None)
     additional_notes: str | None = Field(None)
 
-    def get_dietary_requirements_summary(self) -> str:
-        """Get a summary of dietary requirements."""
+    @cached_property
+    def dietary_requirements_summary(self) -> str:
+        """Summary of dietary requirements, computed once per (frozen) instance."""
         requirements = []
         if self.has_vegans:
             requirements.append(
@@ -53,9 +66,13 @@ class UserPreferences(BaseModel):
 
         return ", ".join(requirements) if requirements else "No special requirements"
 
+    def get_dietary_requirements_summary(self) -> str:
+        """Get a summary of dietary requirements."""
+        return self.dietary_requirements_summary
+
     def get_all_allergens(self) -> list[str]:
         allergens: list[str] = [a.value for a in self.allergies]
         allergens.extend(self.custom_allergies)
         return allergens
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
@@ -0,0 +1,288 @@
+from dataclasses import replace
+from unittest.mock import patch
+
+from src.agents.document_parsing_agent import DocumentParsingAgent
+from src.config import settings
+from src.database.extraction_cache import ExtractionCache
+
+SAMPLE_RECIPE = {
+    "name": "Panettone",
+    "description": "Sweet Christmas bread",
+    "category": "dessert",
+    "ingredients": ["flour", "sugar", "raisins"],
+    "instructions": ["Mix", "Bake"],
+}
+
+
+def test_document_parsing_agent_is_correctly_initialized():
+    """Test that DocumentParsingAgent is correctly initialized."""
+    agent = DocumentParsingAgent(cache=ExtractionCache(path=":memory:"))
+    assert agent.name == "document_parsing_agent"
+    assert agent._cache is not None
+
+
+def test_document_parsing_agent_without_cache():
+    """Test that caching can be disabled."""
+    agent = DocumentParsingAgent(use_cache=False)
+    assert agent._cache is None
+
+
+@patch.object(DocumentParsingAgent, "_extract_recipes_uncached")
+def test_extract_recipes_uses_cache_on_repeated_text(mock_extract):
+    """Test that identical documents only reach the LLM once."""
+    mock_extract.return_value = [SAMPLE_RECIPE]
+    agent = DocumentParsingAgent(cache=ExtractionCache(path=":memory:"))
+
+    first = agent.extract_recipes("Panettone recipe text")
+    second = agent.extract_recipes("Panettone recipe text")
+
+    assert first == [SAMPLE_RECIPE]
+    assert second == [SAMPLE_RECIPE]
+    mock_extract.assert_called_once()
+
+
+@patch.object(DocumentParsingAgent, "_extract_recipes_uncached")
+def test_extract_recipes_does_not_cache_empty_results(mock_extract):
+    """Test that failed extractions are retried on the next call."""
+    mock_extract.return_value = []
+    agent = DocumentParsingAgent(cache=ExtractionCache(path=":memory:"))
+
+    agent.extract_recipes("Unparseable text")
+    agent.extract_recipes("Unparseable text")
+
+    assert mock_extract.call_count == 2
+
+
+def test_extraction_cache_persists_to_disk(tmp_path):
+    """Test that cached extractions survive a new cache instance."""
+    path = str(tmp_path / "cache.db")
+    ExtractionCache(path=path, namespace="v1").set("text", [SAMPLE_RECIPE])
+
+    assert ExtractionCache(path=path, namespace="v1").get("text") == [SAMPLE_RECIPE]
+    assert ExtractionCache(path=path, namespace="v2").get("text") is None
+
+
+def test_extraction_cache_semantic_hit():
+    """Test that near-identical texts hit through the embedding tier."""
+
+    class FakeEmbedder:
+        def embed(self, text):
+            return [1.0, 0.01 * len(text)]
+
+    cache = ExtractionCache(path=":memory:", embedder=FakeEmbedder())
+    cache.set("Panettone recipe", [SAMPLE_RECIPE])
+
+    assert cache.get("Panettone recipe!") == [SAMPLE_RECIPE]
+
+
+def test_extraction_cache_treats_failures_as_misses():
+    """Test that embedding outages and corrupt rows become misses, not errors."""
+
+    class OfflineEmbedder:
+        def embed(self, text):
+            raise OSError("offline")
+
+    cache = ExtractionCache(path=":memory:", embedder=OfflineEmbedder())
+    cache.set("Panettone recipe", [SAMPLE_RECIPE])
+    cache._conn.execute("UPDATE extractions SET recipes = 'not json'")
+
+    assert cache.get("Panettone recipe") is None
+    assert cache.get("Pandoro recipe") is None
+
+
+def test_extract_json_from_response_formats():
+    """Test that JSON is extracted from fenced, bare and wrapped responses."""
+    agent = DocumentParsingAgent(use_cache=False)
+
+    fenced = '```json\n[{"name": "Pandoro"}]\n```'
+    bare = 'Here you go: [{"name": "Pandoro"}] enjoy!'
+    single = 'Result: {"name": "Pandoro"}'
+
+    assert agent._extract_json_from_response(fenced) == [{"name": "Pandoro"}]
+    assert agent._extract_json_from_response(bare) == [{"name": "Pandoro"}]
+    assert agent._extract_json_from_response(single) == [{"name": "Pandoro"}]
+
+
+def test_extract_json_from_response_invalid():
+    """Test that unparseable responses return an empty list."""
+    agent = DocumentParsingAgent(use_cache=False)
+
+    assert agent._extract_json_from_response("```json\n[not json]\n```") == []
+    assert agent._extract_json_from_response("no json here") == []
+
+
+def test_extract_json_from_response_ignores_trailing_brackets():
+    """Test that text after the first JSON value does not break parsing."""
+    agent = DocumentParsingAgent(use_cache=False)
+
+    response = 'Recipes: [{"name": "Struffoli"}] (see [notes] below)'
+
+    assert agent._extract_json_from_response(response) == [{"name": "Struffoli"}]
+
+
+def test_extract_recipes_batch_single_call():
+    """Test that several documents are extracted with one structured call."""
+    from unittest.mock import Mock
+
+    from src.models.extracted_recipe import (
+        BatchRecipeList,
+        DocumentRecipes,
+        ExtractedRecipe,
+    )
+
+    agent = DocumentParsingAgent(use_cache=False)
+    recipe = ExtractedRecipe(**SAMPLE_RECIPE)
+    response = Mock()
+    response.structured_data = [
+        BatchRecipeList(
+            documents=[
+                DocumentRecipes(doc_index=1, recipes=[]),
+                DocumentRecipes(doc_index=0, recipes=[recipe]),
+            ]
+        )
+    ]
+
+    with patch.object(
+        agent._client, "structured_response", return_value=response
+    ) as mock_structured:
+        results = agent.extract_recipes_batch(["doc one", "doc two"])
+
+    mock_structured.assert_called_once()
+    assert results[0][0]["name"] == "Panettone"
+    assert results[1] == []
+
+
+@patch.object(DocumentParsingAgent, "extract_recipes")
+def test_extract_recipes_batch_falls_back_per_document(mock_extract):
+    """Test that a failed batch call falls back to single-document extraction."""
+    mock_extract.return_value = [SAMPLE_RECIPE]
+    agent = DocumentParsingAgent(use_cache=False)
+
+    with patch.object(
+        agent._client, "structured_response", side_effect=ValueError("bad")
+    ):
+        results = agent.extract_recipes_batch(["doc one", "doc two"])
+
+    assert results == [[SAMPLE_RECIPE], [SAMPLE_RECIPE]]
+    assert mock_extract.call_count == 2
+
+
+def test_iter_json_array_items_yields_objects_incrementally():
+    """Test that array items are parsed as soon as they are complete."""
+    from src.agents.document_parsing_agent import _iter_json_array_items
+
+    chunks = ['```json\n[{"name": "Pan', 'ettone"}, {"na', 'me": "Pandoro"}]\n```']
+    seen = []
+    for item in _iter_json_array_items(iter(chunks)):
+        seen.append(item["name"])
+
+    assert seen == ["Panettone", "Pandoro"]
+
+
+def test_extract_recipes_iter_streams_recipes():
+    """Test that extract_recipes_iter yields validated recipes from a stream."""
+    from unittest.mock import Mock
+
+    agent = DocumentParsingAgent(use_cache=False)
+    payload = '[{"name": "Panettone", "description": "Bread", "category": "dessert"}]'
+    stream = [Mock(delta=payload[:20]), Mock(delta=payload[20:])]
+
+    with patch.object(agent._client, "stream_invoke", return_value=iter(stream)):
+        recipes = list(agent.extract_recipes_iter("text"))
+
+    assert len(recipes) == 1
+    assert recipes[0]["name"] == "Panettone"
+    assert recipes[0]["servings"] == 4
+
+
+@patch.object(DocumentParsingAgent, "_extract_recipes_uncached")
+def test_extract_recipes_many_keeps_input_order(mock_extract):
+    """Test that concurrent extraction returns results in input order."""
+    mock_extract.side_effect = lambda text: [{"name": text}]
+    agent = DocumentParsingAgent(use_cache=False)
+
+    results = agent.extract_recipes_many(["a", "b", "c"], max_inflight=3)
+
+    assert results == [[{"name": "a"}], [{"name": "b"}], [{"name": "c"}]]
+
+
+def test_extract_json_from_response_prefers_outer_object():
+    """Test that an array nested in a bare object is not mistaken for the result."""
+    agent = DocumentParsingAgent(use_cache=False)
+
+    response = 'Result: {"name": "Pandoro", "allergens": ["eggs"]}'
+
+    assert agent._extract_json_from_response(response) == [
+        {"name": "Pandoro", "allergens": ["eggs"]}
+    ]
+
+
+def test_extract_json_from_response_unwraps_recipe_list_object():
+    """Test that a {"recipes": [...]} reply yields the recipes, not the wrapper."""
+    agent = DocumentParsingAgent(use_cache=False)
+
+    response = 'Here you go: {"recipes": [{"name": "a"}, {"name": "b"}]}'
+    fenced = '```json\n{"recipes": [{"name": "a"}]}\n```'
+
+    assert agent._extract_json_from_response(response) == [
+        {"name": "a"},
+        {"name": "b"},
+    ]
+    assert agent._extract_json_from_response(fenced) == [{"name": "a"}]
+
+
+def test_extract_recipes_uses_structured_response():
+    """Test that single-document extraction goes through the structured client call."""
+    from unittest.mock import Mock
+
+    from src.agents.document_parsing_agent import ExtractedRecipe, RecipeList
+
+    agent = DocumentParsingAgent(use_cache=False)
+    response = Mock()
+    response.structured_data = [RecipeList(recipes=[ExtractedRecipe(**SAMPLE_RECIPE)])]
+
+    with patch.object(
+        agent._client, "structured_response", return_value=response
+    ) as mock_structured:
+        recipes = agent.extract_recipes("Panettone recipe text")
+
+    mock_structured.assert_called_once()
+    assert recipes[0]["name"] == "Panettone"
+
+
+@patch.object(DocumentParsingAgent, "_extract_recipes_uncached")
+def test_extract_recipes_drops_duplicates(mock_extract):
+    """Test that the same recipe extracted twice is only returned once."""
+    duplicate = {
+        **SAMPLE_RECIPE,
+        "name": " panettone ",
+        "ingredients": ["Sugar", "flour", "raisins"],
+    }
+    mock_extract.return_value = [SAMPLE_RECIPE, duplicate, {"name": "Pandoro"}]
+    agent = DocumentParsingAgent(use_cache=False)
+
+    recipes = agent.extract_recipes("Cookbook text")
+
+    assert recipes == [SAMPLE_RECIPE, {"name": "Pandoro"}]
+
+
+def test_fast_dump_matches_model_dump():
+    """Test that the field-copy dump produces the same dicts as pydantic."""
+    from src.agents.document_parsing_agent import ExtractedRecipe
+
+    agent = DocumentParsingAgent(use_cache=False)
+    recipes = [
+        ExtractedRecipe(**SAMPLE_RECIPE),
+        ExtractedRecipe(name="Pandoro", description="", category="dessert"),
+    ]
+
+    assert agent._dump_recipes(recipes) == [r.model_dump() for r in recipes]
+
+
+def test_document_parsing_agent_cache_is_opt_in():
+    """Test that no extraction cache is opened unless enabled."""
+    with patch(
+        "src.agents.document_parsing_agent.settings",
+        replace(settings, EXTRACTION_CACHE_ENABLED=False),
+    ):
+        assert DocumentParsingAgent()._cache is None
@@ -1,3 +1,5 @@
+import json
+
 from src.config import settings, get_model_name, get_provider_name
 from src.agents.info_checker import InfoCheckerAgent
 
@@ -14,6 +16,34 @@ def test_settings_should_return_correct_infos(monkeypatch):
     assert settings.is_ollama() is False
 
 
+def test_settings_copy_answers_for_its_own_provider():
+    """Test that provider helpers read the instance they are called on."""
+    from dataclasses import replace
+
+    from src.config.settings import LLMProvider
+
+    ollama = replace(settings, LLM_PROVIDER=LLMProvider.OLLAMA, OLLAMA_MODEL="qwen")
+
+    assert ollama.is_ollama() is True
+    assert ollama.is_openai() is False
+    assert ollama.get_model() == "qwen"
+    assert ollama.get_provider_info().startswith("Ollama (qwen)")
+    assert settings.is_ollama() is False
+
+
+def test_connection_returns_false_when_client_fails():
+    """Test that a failing connection check reports False instead of raising."""
+    from unittest.mock import patch
+
+    from src.config import test_connection as check_connection
+
+    with patch(
+        "src.config.client_factory.get_shared_client",
+        side_effect=RuntimeError("offline"),
+    ):
+        assert check_connection() is False
+
+
 def test_agent_info_checker_is_correctly_initialized():
     agent = InfoCheckerAgent()
     assert agent.name == "info_checker"
@@ -45,3 +75,114 @@ def test_agent_info_checker_should_correctly_extract_preferences():
     assert "2" in result["summary"] or "two" in result["summary"].lower()
     assert "1" in result["summary"] or "one" in result["summary"].lower()
     assert "gluten" in result["summary"].lower()
+
+
+def test_create_preferences_object_splits_allergies():
+    """Test that known allergies map to the enum and the rest become custom."""
+    from src.agents.info_checker import create_preferences_object
+
+    result = json.loads(
+        create_preferences_object(number_of_guests=4, allergies=" Nuts , kiwi,gluten, ")
+    )
+
+    assert result["preferences"]["allergies"] == ["nuts", "gluten"]
+    assert result["preferences"]["custom_allergies"] == ["kiwi"]
+
+
+def test_finalize_extraction_splits_lists():
+    """Test that missing fields and questions are split and trimmed."""
+    from src.agents.info_checker import _create_finalize_extraction_tool
+
+    holder = {"result": None}
+    finalize = _create_finalize_extraction_tool(holder)
+    finalize(
+        is_complete=False,
+        missing_info=" number_of_guests , allergies,",
+        questions="How many guests? |  Any allergies?| ",
+    )
+
+    assert holder["result"]["missing_info"] == ["number_of_guests", "allergies"]
+    assert holder["result"]["questions"] == ["How many guests?", "Any allergies?"]
+
+
+def test_bounded_memory_summarizes_evicted_turns():
+    """Test that old turns are folded into one summary turn and repeats are skipped."""
+    from src.agents.info_checker import BoundedMemory
+
+    memory = BoundedMemory(max_turns=4)
+    assert memory.add_exchange("We are 8 guests", "Any allergies?") is True
+    assert memory.add_exchange("We are 8 guests", "Any allergies?") is False
+    memory.add_exchange("No allergies", "Great!")
+    memory.add_exchange("Traditional please", "Sure!")
+
+    assert len(memory) == 5
+    assert "We are 8 guests" in memory[0][0].content
+    assert memory[1][0].content == "No allergies"
+
+    memory.clear()
+    assert len(memory) == 0
+
+
+def test_extract_preferences_skips_llm_for_trivial_first_message():
+    """Test that an information-free opening message is answered without the LLM."""
+    from unittest.mock import patch
+
+    agent = InfoCheckerAgent()
+    with patch.object(agent, "run") as mock_run:
+        result = agent.extract_preferences("Hi! I need a Christmas menu")
+        agent.extract_preferences("Hello again")
+
+    assert mock_run.call_count == 1
+    assert result["missing_info"] == [
+        "number_of_guests",
+        "dietary_restrictions",
+        "allergies",
+    ]
+    assert len(result["questions"]) == 3
+
+
+def test_ask_missing_info_uses_question_table():
+    """Test that only unanswered questions are asked."""
+    agent = InfoCheckerAgent()
+
+    questions = agent.ask_missing_info({"has_vegans": True}, ["number_of_guests"])
+
+    assert questions.splitlines() == [
+        "How many guests are you expecting for Christmas dinner?",
+        "Does anyone have food allergies I should be aware of?",
+    ]
+    assert (
+        agent.ask_missing_info({"has_vegetarians": True, "allergies": ["nuts"]}, [])
+        == "I have all the information I need!"
+    )
+    assert len(agent.ask_missing_info(None, ["number_of_guests"]).splitlines()) == 3
+
+
+def test_mentioned_topics_flags_each_category():
+    """Test that one scan reports every topic a message mentions."""
+    from src.agents.info_checker import _mentioned_topics
+
+    assert _mentioned_topics("Hello there") == set()
+    assert _mentioned_topics("Eight people, two vegans, no nuts") == {
+        "number_of_guests",
+        "dietary_restrictions",
+        "allergies",
+    }
+
+
+def test_get_memory_summary_is_bounded():
+    """Test that the memory summary only serializes the most recent turns."""
+    agent = InfoCheckerAgent()
+    for i in range(agent.RECENT_TURNS):
+        agent._remember(f"message {i}", f"reply {i}")
+
+    turns = json.loads(agent.get_memory_summary())
+
+    assert len(turns) == agent.RECENT_TURNS
+    assert turns[-1] == {
+        "role": "assistant",
+        "blocks": [{"type": "text", "content": f"reply {agent.RECENT_TURNS - 1}"}],
+    }
+
+    agent.clear_memory()
+    assert agent.get_memory_summary() == "[]"
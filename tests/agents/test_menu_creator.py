@@ -351,3 +351,205 @@ def test_create_menu_with_agents_return_structure(mock_run):
     assert result["number_of_guests"] == 8
     assert result["dietary_accommodations"]["vegetarian_options"] is True
     assert result["dietary_accommodations"]["vegan_options"] is False
+
+
+def test_format_final_menu_centers_wide_titles():
+    """Test that titles with wide characters keep the banner aligned."""
+    from src.agents.menu_creator import _display_width
+
+    lines = {}
+    for title in ("Christmas Dinner", "Natale 🎅 2025"):
+        menu = format_final_menu(
+            title=title,
+            appetizers="A",
+            main_dishes="M",
+            second_plates="S",
+            desserts="D",
+            number_of_guests=4,
+        )
+        lines[title] = next(line for line in menu.splitlines() if title in line)
+
+    assert _display_width(lines["Christmas Dinner"]) == _display_width(
+        lines["Natale 🎅 2025"]
+    )
+
+
+@patch.object(MenuCreatorAgent, "run")
+def test_create_menu_extracts_preferences_once(mock_run):
+    """Test that create_menu reuses the dietary info for prompt and result."""
+    mock_run.return_value = Mock(text="Menu")
+    agent = MenuCreatorAgent()
+
+    with patch.object(
+        agent, "_extract_preferences", wraps=agent._extract_preferences
+    ) as mock_extract:
+        agent.create_menu({"number_of_guests": 4}, "A", "M", "S", "D")
+
+    mock_extract.assert_called_once()
+
+
+@patch.object(MenuCreatorAgent, "run")
+def test_create_menu_with_agents_gathers_suggestions_up_front(mock_run):
+    """Test that connected course agents are queried before the single menu run."""
+    from src.agents.recipe_agents import AppetizerAgent, DessertAgent
+
+    mock_run.return_value = Mock(text="Menu")
+    appetizer_agent, dessert_agent = AppetizerAgent(), DessertAgent()
+    agent = MenuCreatorAgent(recipe_agents=[appetizer_agent, dessert_agent])
+
+    with (
+        patch.object(
+            appetizer_agent,
+            "search",
+            return_value={"category": "appetizer", "raw_response": "Crostini"},
+        ),
+        patch.object(
+            dessert_agent,
+            "search",
+            return_value={"category": "dessert", "raw_response": "Panettone"},
+        ),
+    ):
+        agent.create_menu_with_agents({"number_of_guests": 4, "has_vegans": True})
+
+    mock_run.assert_called_once()
+    prompt = mock_run.call_args[0][0]
+    assert "Crostini" in prompt
+    assert "Panettone" in prompt
+
+
+def test_create_menu_batch_keeps_item_order():
+    """Test that batch menu creation returns one result per item in order."""
+    agent = MenuCreatorAgent()
+
+    async def fake_a_run(prompt, tool_choice="auto"):
+        return Mock(text=prompt.split("APPETIZER SUGGESTIONS:\n")[1].split("\n")[0])
+
+    with patch.object(agent, "a_run", side_effect=fake_a_run) as mock_a_run:
+        results = agent.create_menu_batch(
+            [
+                ({"number_of_guests": 2}, "First", "M", "S", "D"),
+                ({"number_of_guests": 6, "has_vegans": True}, "Second", "M", "S", "D"),
+            ],
+            max_concurrency=2,
+        )
+
+    assert mock_a_run.call_count == 2
+    assert [r["formatted_menu"] for r in results] == ["First", "Second"]
+    assert [r["number_of_guests"] for r in results] == [2, 6]
+    assert results[1]["dietary_accommodations"]["vegan_options"] is True
+
+
+@patch.object(MenuCreatorAgent, "run")
+def test_create_menu_reuses_cached_menu(mock_run):
+    """Test that an opted-in repeated request does not call the LLM again."""
+    mock_run.return_value = Mock(text="Cached menu")
+    agent = MenuCreatorAgent()
+    request = ({"number_of_guests": 4}, "A", "M", "S", "D")
+
+    first = agent.create_menu(*request, cache=True)
+    second = agent.create_menu(*request, cache=True)
+    agent.create_menu(*request)
+
+    assert first == second
+    assert second["formatted_menu"] == "Cached menu"
+    assert mock_run.call_count == 2
+
+
+def test_menu_creator_extract_preferences_mixed_allergy_types():
+    """Test that string and list allergy fields are combined into one list."""
+    agent = MenuCreatorAgent()
+
+    result = agent._extract_preferences(
+        {
+            "number_of_guests": 4,
+            "allergies": "nuts, dairy",
+            "custom_allergies": ["kiwi"],
+        }
+    )
+    assert result["allergens"] == ["nuts", "dairy", "kiwi"]
+
+    result = agent._extract_preferences(
+        {"number_of_guests": 4, "allergies": ["gluten"], "custom_allergies": "kiwi"}
+    )
+    assert result["allergens"] == ["gluten", "kiwi"]
+
+
+def test_menu_creator_sends_system_prompt_once():
+    """Test that the outgoing request carries the system prompt exactly once."""
+    import json
+
+    agent = MenuCreatorAgent(api_key="sk-test")
+    openai_client = Mock()
+    openai_client.responses.create.side_effect = RuntimeError("stop")
+    openai_client.responses.parse.side_effect = RuntimeError("stop")
+
+    with (
+        patch.object(agent._client, "client", openai_client),
+        pytest.raises(RuntimeError, match="stop"),
+    ):
+        agent.run("Plan a menu")
+
+    responses = openai_client.responses
+    sent = responses.parse.call_args or responses.create.call_args
+    payload = json.dumps(sent.kwargs["input"])
+    assert payload.count(json.dumps(MenuCreatorAgent.SYSTEM_PROMPT)[1:-1]) == 1
+
+
+@patch.object(MenuCreatorAgent, "run")
+def test_create_menu_with_agents_serves_canned_traditional_menu(mock_run):
+    """Test that a menu without dietary signals skips the LLM run."""
+    agent = MenuCreatorAgent()
+
+    result = agent.create_menu_with_agents({"number_of_guests": 6})
+
+    mock_run.assert_not_called()
+    assert "Panettone" in result["formatted_menu"]
+    assert "For 6 Guests" in result["formatted_menu"]
+    assert result["dietary_accommodations"]["allergens_avoided"] == []
+
+
+@patch.object(MenuCreatorAgent, "run")
+def test_create_menu_with_agents_plans_menu_for_time_limits(mock_run):
+    """Test that difficulty and time limits are never answered with the canned menu."""
+    mock_run.return_value = Mock(text="Quick menu")
+    agent = MenuCreatorAgent()
+
+    easy = agent.create_menu_with_agents(
+        {"number_of_guests": 6, "max_difficulty": "easy"}
+    )
+    quick = agent.create_menu_with_agents(
+        {"number_of_guests": 6, "max_prep_time_minutes": 30}
+    )
+
+    assert mock_run.call_count == 2
+    assert easy["formatted_menu"] == quick["formatted_menu"] == "Quick menu"
+
+
+def test_create_menu_streaming_sync_yields_async_steps():
+    """Test that the sync shim yields each step of the async menu stream."""
+    agent = MenuCreatorAgent()
+
+    async def fake_stream(prompt):
+        for text in ("Planning", "Menu"):
+            yield Mock(text=text)
+
+    with patch.object(agent, "a_stream_invoke", side_effect=fake_stream) as mock_stream:
+        steps = list(
+            agent.create_menu_streaming_sync({"number_of_guests": 4}, "", "", "", "")
+        )
+
+    assert [step.text for step in steps] == ["Planning", "Menu"]
+    assert "Number of guests: 4" in mock_stream.call_args[0][0]
+
+
+def test_extract_preferences_joins_allergens_once():
+    """Test that the comma-joined allergens string is returned with the list."""
+    agent = MenuCreatorAgent()
+
+    with_allergens = agent._extract_preferences(
+        {"number_of_guests": 4, "allergies": ["nuts"], "custom_allergies": "kiwi"}
+    )
+    without_allergens = agent._extract_preferences({"number_of_guests": 4})
+
+    assert with_allergens["allergens_str"] == "nuts, kiwi"
+    assert without_allergens["allergens_str"] == "None"
@@ -1,5 +1,63 @@
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
+
 from src.agents.orchestrator import ChristmasMenuOrchestrator, create_orchestrator
+from src.config import settings
+
+COMPLETE_PREFERENCES = {"is_complete": True, "preferences": {"number_of_guests": 4}}
+SUGGESTIONS = {"raw_response": "Suggestions"}
+MENU = {"formatted_menu": "Menu"}
+COURSES = ("appetizer", "main_dish", "second_plate", "dessert")
+
+
+def _mock_result(value):
+    """Use callables and exceptions as side effects, anything else as return value."""
+    if callable(value) or isinstance(value, BaseException):
+        return {"side_effect": value}
+    return {"return_value": value}
+
+
+@contextmanager
+def _patched_agents(
+    orchestrator,
+    preferences=COMPLETE_PREFERENCES,
+    searches=None,
+    menu_method="create_menu",
+    menu_result=MENU,
+):
+    """Patch the info checker, the four course searches and the menu creator.
+
+    ``searches`` overrides the result of single courses by name, and a
+    ``menu_method`` of None leaves the menu creator alone. Yields the mocks as
+    ``info``, ``search[course]`` and ``menu``.
+    """
+    searches = searches or {}
+    with ExitStack() as stack:
+        info = stack.enter_context(
+            patch.object(
+                orchestrator.info_checker,
+                "extract_preferences",
+                **_mock_result(preferences),
+            )
+        )
+        search = {
+            course: stack.enter_context(
+                patch.object(
+                    getattr(orchestrator, f"{course}_agent"),
+                    "search",
+                    **_mock_result(searches.get(course, SUGGESTIONS)),
+                )
+            )
+            for course in COURSES
+        }
+        menu = menu_method and stack.enter_context(
+            patch.object(
+                orchestrator.menu_creator, menu_method, **_mock_result(menu_result)
+            )
+        )
+        yield SimpleNamespace(info=info, search=search, menu=menu)
 
 
 @patch("src.agents.orchestrator.RecipeVectorStore")
@@ -262,6 +320,27 @@ def test_orchestrator_reload_recipes_with_json_file(
     mock_loader.load_sample_recipes.assert_called()
 
 
+@patch("src.agents.orchestrator.RecipeLoader")
+@patch("src.agents.orchestrator.RecipeVectorStore")
+def test_orchestrator_reload_recipes_incremental(
+    mock_vector_store_class, mock_loader_class
+):
+    """Test that an incremental reload keeps the store and syncs the recipes."""
+    mock_store = MagicMock()
+    mock_vector_store_class.return_value = mock_store
+    mock_loader_class.return_value.load_from_json_file.return_value = 7
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    count = orchestrator.reload_recipes("recipes.json", incremental=True)
+
+    assert count == 7
+    mock_store.clear_all.assert_not_called()
+    mock_loader_class.return_value.load_from_json_file.assert_called_once_with(
+        "recipes.json", incremental=True
+    )
+
+
 @patch("src.agents.orchestrator.RecipeVectorStore")
 @patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
 def test_run_return_type_and_structure(mock_ensure, mock_vector_store_class):
@@ -507,7 +586,7 @@ def test_run_streaming_yields_correct_structure(mock_ensure, mock_vector_store_c
         ),
         patch.object(
             orchestrator.menu_creator,
-            "create_menu_streaming",
+            "create_menu_streaming_sync",
             return_value=iter([mock_step]),
         ),
     ):
@@ -644,3 +723,479 @@ def test_run_with_native_agents_calls_menu_creator(
         mock_create.assert_called_once()
         call_args = mock_create.call_args[0][0]
         assert call_args["number_of_guests"] == 4
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_async_gathers_recipe_searches(mock_ensure, mock_vector_store_class):
+    """Test that run_async stores each concurrent search under its category."""
+    import asyncio
+
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    searches = {course: {"raw_response": course[0].upper()} for course in COURSES}
+
+    with _patched_agents(orchestrator, searches=searches) as mocks:
+        result = asyncio.run(orchestrator.run_async("Menu for 4"))
+
+    assert result["agent_outputs"]["appetizer"]["raw_response"] == "A"
+    assert result["agent_outputs"]["dessert"]["raw_response"] == "D"
+    assert mocks.menu.call_args.kwargs["second_plate_suggestions"] == "S"
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_async_streaming_passes_suggestions_to_menu(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that run_async_streaming builds the menu from the recipe searches."""
+    import asyncio
+
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    async def fake_streaming(**kwargs):
+        yield MagicMock(text="Menu", delta=None)
+
+    async def collect():
+        return [e async for e in orchestrator.run_async_streaming("Menu for 4")]
+
+    with _patched_agents(
+        orchestrator,
+        searches={"dessert": {"raw_response": "D"}},
+        menu_method="create_menu_streaming",
+        menu_result=fake_streaming,
+    ) as mocks:
+        events = asyncio.run(collect())
+
+    assert mocks.menu.call_args.kwargs["dessert_suggestions"] == "D"
+    assert events[-1] == {
+        "type": "complete",
+        "menu": "Menu",
+        "preferences": {"number_of_guests": 4},
+    }
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_streaming_reports_every_recipe_search(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that run_streaming yields one progress event per pooled search."""
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    with _patched_agents(
+        orchestrator,
+        menu_method="create_menu_streaming_sync",
+        menu_result=iter([Mock(text="Menu", index=0)]),
+    ):
+        results = list(orchestrator.run_streaming("Menu for 4"))
+
+    steps = {r["step"] for r in results if r["type"] == "progress"}
+    assert steps == {"info_checker", *COURSES}
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_reuses_cached_responses(mock_ensure, mock_vector_store_class):
+    """Test that a repeated request is served from the response cache."""
+    from src.database.response_cache import ResponseCache
+
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(
+        initialize_db=False, cache=ResponseCache(path=":memory:")
+    )
+
+    with _patched_agents(orchestrator) as mocks:
+        first = orchestrator.run("Menu for 4 people")
+        second = orchestrator.run("Menu for 4 people")
+
+    mocks.info.assert_called_once()
+    mocks.search["appetizer"].assert_called_once()
+    mocks.menu.assert_called_once()
+    assert second["menu"] == "Menu"
+    assert first["agent_outputs"]["appetizer"] == SUGGESTIONS
+    assert second["agent_outputs"]["appetizer"] == SUGGESTIONS
+
+
+@patch("src.agents.orchestrator.MenuCreatorAgent")
+@patch("src.agents.orchestrator.InfoCheckerAgent")
+@patch("src.agents.orchestrator.RecipeVectorStore")
+def test_orchestrator_creates_agents_lazily(
+    mock_vector_store_class, mock_info_checker_class, mock_menu_creator_class
+):
+    """Test that agents and the vector store are only built on first access."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    mock_vector_store_class.assert_not_called()
+    mock_info_checker_class.assert_not_called()
+    mock_menu_creator_class.assert_not_called()
+
+    assert orchestrator.info_checker is orchestrator.info_checker
+    mock_info_checker_class.assert_called_once()
+
+
+def test_condense_suggestions_strips_markdown_and_repeats():
+    """Test that suggestions lose markdown, blank and repeated lines and are capped."""
+    text = "## Appetizers\n\n1. **Crostini** - toast\n---\n1. **Crostini** - toast\n"
+
+    condensed = ChristmasMenuOrchestrator._condense_suggestions(text)
+    capped = ChristmasMenuOrchestrator._condense_suggestions(
+        "a" * 10 + "\n" + "b" * 10, max_chars=15
+    )
+
+    assert condensed == "Appetizers\n1. Crostini - toast"
+    assert capped == "a" * 10
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_streaming_reports_deltas_for_streamed_chunks(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that streamed menu chunks are reported by their delta, not re-sliced."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    chunks = [
+        Mock(text="Menu", delta="Menu", index=0),
+        Mock(text="Menu: Panettone" + "!" * 100, delta=": Panettone", index=0),
+    ]
+
+    with _patched_agents(
+        orchestrator,
+        menu_method="create_menu_streaming_sync",
+        menu_result=iter(chunks),
+    ):
+        results = list(orchestrator.run_streaming("Menu for 4"))
+
+    messages = [r["message"] for r in results if r["type"] == "step"]
+    assert messages == ["Menu", ": Panettone"]
+    assert results[-1]["menu"] == chunks[-1].text
+
+
+@patch("src.agents.orchestrator.RecipeLoader")
+@patch("src.agents.orchestrator.RecipeVectorStore")
+def test_orchestrator_loads_recipes_in_background(
+    mock_vector_store_class, mock_loader_class
+):
+    """Test that sample recipes load off the constructor and are awaited on use."""
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+    mock_loader_class.return_value.load_sample_recipes.return_value = 3
+
+    orchestrator = ChristmasMenuOrchestrator()
+    orchestrator.get_recipe_count()
+
+    assert orchestrator._db_ready.is_set()
+    mock_loader_class.return_value.load_sample_recipes.assert_called_once()
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_without_cache_creates_a_fresh_menu(mock_ensure, mock_vector_store_class):
+    """Test that use_cache=False asks the menu creator's LLM on every run."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False, use_cache=False)
+
+    with (
+        _patched_agents(orchestrator, menu_method=None),
+        patch.object(
+            orchestrator.menu_creator, "run", return_value=Mock(text="Menu")
+        ) as mock_llm,
+    ):
+        orchestrator.run({"number_of_guests": 4})
+        orchestrator.run({"number_of_guests": 4})
+
+    assert mock_llm.call_count == 2
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_reuses_result_of_similar_request(mock_ensure, mock_vector_store_class):
+    """Test that a similar request reuses the result unless counts or diets differ."""
+    import asyncio
+
+    from src.database.extraction_cache import ExtractionCache
+
+    class FakeEmbedder:
+        def embed(self, text):
+            return [1.0, 0.01 * len(text)]
+
+    orchestrator = ChristmasMenuOrchestrator(
+        initialize_db=False,
+        semantic_cache=ExtractionCache(path=":memory:", embedder=FakeEmbedder()),
+    )
+
+    def extract(request):
+        return {
+            "is_complete": True,
+            "preferences": {
+                "number_of_guests": int(request.split()[-2]),
+                "allergies": ["nuts"] if "nut" in request else [],
+            },
+        }
+
+    with _patched_agents(orchestrator, preferences=extract) as mocks:
+        first = orchestrator.run("Christmas menu for 6 people")
+        similar = orchestrator.run("Christmas menu for 6 people!")
+        assert similar == first
+        assert mocks.menu.call_count == 1
+
+        orchestrator.run("Christmas menu for 8 people")
+        orchestrator.run("Christmas menu, nut allergy, 6 people")
+        orchestrator.run("Christmas menu for 6 people", interactive=True)
+
+        assert mocks.info.call_count == 5
+        assert mocks.menu.call_count == 4
+
+        again = asyncio.run(orchestrator.run_async("Christmas menu for 6 people"))
+        assert again == first
+        assert mocks.menu.call_count == 4
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_with_structured_request_skips_info_checker(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that a preferences dict is validated without calling the info checker."""
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    with _patched_agents(orchestrator) as mocks:
+        result = orchestrator.run({"number_of_guests": 5, "allergies": ["nuts"]})
+
+    mocks.info.assert_not_called()
+    assert result["success"] is True
+    assert result["agent_outputs"]["info_checker"]["skipped"] is True
+    preferences = mocks.search["dessert"].call_args[0][0]
+    assert preferences["number_of_guests"] == 5
+    assert preferences["allergies"] == ["nuts"]
+    assert preferences["prefer_traditional"] is True
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+def test_extract_preferences_reports_invalid_structured_request(
+    mock_vector_store_class,
+):
+    """Test that a malformed preferences dict is reported as incomplete, not raised."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    result = orchestrator._extract_preferences(
+        {"number_of_guests": "many", "allergies": ["gravel"]}
+    )
+
+    assert result["is_complete"] is False
+    assert result["preferences"] is None
+    assert result["missing_info"] == ["allergies", "number_of_guests"]
+    assert "error" in result
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_interactive_reports_invalid_structured_request(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that an invalid preferences dict asks for details instead of raising."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    with _patched_agents(orchestrator) as mocks:
+        result = orchestrator.run({"number_of_guests": "abc"}, interactive=True)
+
+    mocks.menu.assert_not_called()
+    assert result["success"] is False
+    assert result["error"] == "Missing required information"
+    assert result["agent_outputs"]["info_checker"]["missing_info"] == [
+        "number_of_guests"
+    ]
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_interactive_asks_about_a_trivial_first_message(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that an opening message without details gets questions, not a crash."""
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+
+    with patch.object(orchestrator.info_checker, "run") as mock_llm:
+        result = orchestrator.run("Hi, I need a Christmas menu", interactive=True)
+
+    mock_llm.assert_not_called()
+    assert result["success"] is False
+    assert result["error"] == "Missing required information"
+    assert result["agent_outputs"]["info_checker"]["preferences"] == {}
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_async_survives_a_failed_recipe_search(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that one failed category search does not abort the menu."""
+    import asyncio
+
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    searches = {"second_plate": RuntimeError("timeout")}
+
+    with _patched_agents(orchestrator, searches=searches) as mocks:
+        result = asyncio.run(orchestrator.run_async({"number_of_guests": 4}))
+
+    assert result["success"] is True
+    assert result["agent_outputs"]["second_plate"]["error"] == "timeout"
+    assert mocks.menu.call_args.kwargs["second_plate_suggestions"] == ""
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_uses_batched_search_when_enabled(mock_ensure, mock_vector_store_class):
+    """Test that BATCH_SEARCH replaces the four course searches with one call."""
+    mock_store = MagicMock()
+    mock_store.count_recipes.return_value = 0
+    mock_vector_store_class.return_value = mock_store
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    batched = {
+        category: {"category": category, "raw_response": category}
+        for category in ("appetizer", "main_dish", "second_plate", "dessert")
+    }
+
+    with (
+        patch("src.agents.orchestrator.settings", replace(settings, BATCH_SEARCH=True)),
+        patch.object(
+            orchestrator.all_courses_agent, "search_all", return_value=batched
+        ),
+        patch.object(orchestrator.appetizer_agent, "search") as mock_app,
+        patch.object(
+            orchestrator.menu_creator,
+            "create_menu",
+            return_value={"formatted_menu": "Menu"},
+        ) as mock_menu,
+    ):
+        result = orchestrator.run({"number_of_guests": 4})
+
+    mock_app.assert_not_called()
+    assert result["agent_outputs"]["dessert"]["raw_response"] == "dessert"
+    assert mock_menu.call_args.kwargs["appetizer_suggestions"] == "appetizer"
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+def test_follow_up_preferences_are_not_served_from_cache(mock_vector_store_class):
+    """Test that extractions depending on earlier turns bypass the response cache."""
+    from src.agents.info_checker import InfoCheckerAgent
+    from src.database.response_cache import ResponseCache
+
+    orchestrator = ChristmasMenuOrchestrator(
+        initialize_db=False, cache=ResponseCache(path=":memory:")
+    )
+    complete = {"is_complete": True, "preferences": {"number_of_guests": 4}}
+
+    with (
+        patch.object(
+            orchestrator.info_checker, "extract_preferences", return_value=complete
+        ) as mock_extract,
+        patch.object(
+            InfoCheckerAgent, "has_context", new_callable=PropertyMock
+        ) as mock_context,
+    ):
+        mock_context.return_value = False
+        orchestrator._extract_preferences("Also 2 vegans")
+        orchestrator._extract_preferences("Also 2 vegans")
+        assert mock_extract.call_count == 1
+
+        mock_context.return_value = True
+        orchestrator._extract_preferences("Also 2 vegans")
+        assert mock_extract.call_count == 2
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_async_streaming_cancels_searches_when_closed(
+    mock_ensure, mock_vector_store_class
+):
+    """Test that closing the stream early leaves no recipe search task running."""
+    import asyncio
+    import threading
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    release = threading.Event()
+
+    def blocking_search(agent, preferences):
+        release.wait(5)
+        return {"raw_response": ""}
+
+    async def consume():
+        stream = orchestrator.run_async_streaming({"number_of_guests": 4})
+        async for event in stream:
+            if event["type"] == "status" and "dessert" in event["message"]:
+                break
+        await stream.aclose()
+        await asyncio.sleep(0)
+        pending = [
+            t
+            for t in asyncio.all_tasks()
+            if not t.done() and t is not asyncio.current_task()
+        ]
+        release.set()
+        return pending
+
+    with (
+        patch.object(orchestrator, "_prefetch"),
+        patch.object(orchestrator, "_search", side_effect=blocking_search),
+    ):
+        pending = asyncio.run(consume())
+
+    assert pending == []
+
+
+@patch("src.agents.orchestrator.RecipeVectorStore")
+@patch.object(ChristmasMenuOrchestrator, "_ensure_recipes_loaded")
+def test_run_batch_async_keeps_requests_separate(mock_ensure, mock_vector_store_class):
+    """Test that batched requests each start a new conversation and keep their order."""
+    import asyncio
+
+    from src.agents.info_checker import InfoCheckerAgent
+
+    orchestrator = ChristmasMenuOrchestrator(initialize_db=False)
+    orchestrator.info_checker._remember("We are 6", "Any allergies?")
+    conversation = orchestrator.info_checker.get_memory_summary()
+
+    def extract(user_request):
+        guests = int(user_request.split()[-1])
+        return {"is_complete": True, "preferences": {"number_of_guests": guests}}
+
+    with (
+        _patched_agents(orchestrator) as mocks,
+        patch.object(
+            InfoCheckerAgent, "extract_preferences", side_effect=extract
+        ) as mock_extract,
+    ):
+        results = asyncio.run(
+            orchestrator.run_batch_async(
+                ["Menu for 4", "Menu for 8", "Menu for 2"], max_concurrency=2
+            )
+        )
+
+    assert [r["preferences"]["number_of_guests"] for r in results] == [4, 8, 2]
+    assert mock_extract.call_count == 3
+    mocks.info.assert_not_called()
+    assert orchestrator.info_checker.get_memory_summary() == conversation
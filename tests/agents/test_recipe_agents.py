@@ -171,6 +171,19 @@ def test_base_recipe_agent_extract_preferences_empty_allergies():
     assert len(result["allergens"]) == 0
 
 
+def test_base_recipe_agent_extract_preferences_mixed_allergy_types():
+    """Test that string, list and missing allergy fields always combine into a list."""
+    agent = SecondPlateAgent()
+
+    assert agent._extract_preferences(
+        {"allergies": "gluten", "custom_allergies": ["soy"]}
+    )["allergens"] == ["gluten", "soy"]
+    assert agent._extract_preferences({"allergies": None, "custom_allergies": "nuts"})[
+        "allergens"
+    ] == ["nuts"]
+    assert agent._extract_preferences({"allergies": ""})["allergens"] == []
+
+
 def test_base_recipe_agent_build_prompt():
     """Test that _build_prompt creates a proper prompt."""
     agent = DessertAgent()
@@ -284,6 +297,23 @@ def test_recipe_research_agent_search_web_recipes_without_dietary(mock_run):
     assert "Christmas dinner" in prompt
 
 
+def test_recipe_research_agent_stream_web_recipes_yields_each_token_once():
+    """Test that streamed tokens are yielded and the finished step is not repeated."""
+    agent = RecipeResearchAgent()
+    steps = [
+        Mock(delta=None, text=""),
+        Mock(delta="Pan"),
+        Mock(delta="ettone"),
+        Mock(delta=None, text="Panettone"),
+    ]
+
+    with patch.object(agent, "stream_invoke", return_value=iter(steps)) as mock_stream:
+        chunks = list(agent.stream_web_recipes("Christmas bread", "vegan"))
+
+    assert chunks == ["Pan", "ettone"]
+    assert "Christmas bread" in mock_stream.call_args[0][0]
+
+
 def test_base_recipe_agent_get_tools():
     """Test that _get_tools returns the correct tools."""
     agent = AppetizerAgent()
@@ -423,3 +453,113 @@ def test_base_recipe_agent_search_all_agents():
         assert agent.COURSE_NAME is not None
         assert isinstance(agent.RECOMMENDED_COUNT, int)
         assert agent.RECOMMENDED_COUNT > 0
+
+
+def test_course_agents_share_the_rendered_guest_block():
+    """Test that every course agent reuses one rendered guest profile."""
+    from src.agents.recipe_agents import _guest_block
+
+    preferences = {"number_of_guests": 5, "allergies": ["nuts"]}
+    _guest_block.cache_clear()
+
+    prompts = [
+        agent._build_prompt(agent._extract_preferences(preferences))
+        for agent in (AppetizerAgent(), DessertAgent())
+    ]
+
+    assert _guest_block.cache_info().hits == 1
+    assert all("Number of guests: 5" in prompt for prompt in prompts)
+
+
+@patch("src.agents.recipe_agents.get_vector_store")
+def test_all_courses_agent_searches_every_course_in_one_call(mock_get_store):
+    """Test that AllCoursesAgent uses one vector search and one structured call."""
+    from src.agents.recipe_agents import AllCoursesAgent
+    from src.models.course_suggestions import CourseSuggestions
+
+    mock_get_store.return_value.search_recipes_many.return_value = [[], [], [], []]
+    agent = AllCoursesAgent()
+    response = Mock()
+    response.structured_data = [
+        CourseSuggestions(
+            appetizer="Crostini",
+            main_dish="Lasagna",
+            second_plate="Cotechino",
+            dessert="Panettone",
+        )
+    ]
+
+    with patch.object(
+        agent._client, "structured_response", return_value=response
+    ) as mock_structured:
+        results = agent.search_all({"number_of_guests": 4})
+
+    mock_structured.assert_called_once()
+    mock_get_store.return_value.search_recipes_many.assert_called_once()
+    assert results["dessert"]["raw_response"] == "Panettone"
+    assert results["main_dish"]["category"] == "main_dish"
+
+
+@patch("src.agents.recipe_agents.get_vector_store")
+def test_all_courses_agent_filters_candidates_by_diet_and_allergies(mock_get_store):
+    """Test that batched candidates exclude allergens and list vegan recipes first."""
+    from src.agents.recipe_agents import AllCoursesAgent
+    from src.models.recipe import RecipeCategory
+
+    vegan, regular = Mock(), Mock()
+    vegan.name, regular.name = "Vegan lentils", "Cotechino"
+    store = mock_get_store.return_value
+    store.search_recipes_many.side_effect = [
+        [[regular, vegan]] * 4,
+        [[vegan]] * 4,
+    ]
+
+    candidates = AllCoursesAgent()._find_candidates(
+        {"prefer_traditional": True, "allergens": ["nuts"], "has_vegans": True},
+        list(RecipeCategory),
+    )
+
+    general, diet = store.search_recipes_many.call_args_list
+    assert general.kwargs["is_nut_free"] is True
+    assert "is_vegan" not in general.kwargs
+    assert diet.kwargs["is_vegan"] is True
+    assert diet.kwargs["is_nut_free"] is True
+    assert candidates[0] == [vegan, regular]
+
+
+@patch.object(DessertAgent, "run")
+def test_base_recipe_agent_search_leaves_caching_to_the_orchestrator(mock_run):
+    """Test that pooled agents never answer a search from a stale local cache."""
+    mock_run.return_value = Mock(text="Dessert suggestions")
+
+    agent = DessertAgent()
+    preferences = {"number_of_guests": 6, "allergies": ["nuts"]}
+    agent.search(preferences)
+    agent.search(preferences)
+
+    assert mock_run.call_count == 2
+
+
+@patch.object(DessertAgent, "run")
+def test_base_recipe_agent_search_returns_text_when_response_text_is_none(mock_run):
+    """Test that a response without text is reported as a string, never None."""
+    mock_run.return_value = Mock(text=None)
+
+    result = DessertAgent().search({"number_of_guests": 6})
+
+    assert isinstance(result["raw_response"], str)
+
+
+def test_recipe_agents_share_clients_by_configuration():
+    """Test that agents with the same configuration reuse one LLM client."""
+    assert DessertAgent()._client is DessertAgent()._client
+    assert DessertAgent()._client is not AppetizerAgent()._client
+
+
+def test_recipe_agent_get_instance_pools_by_configuration():
+    """Test that get_instance reuses one agent per class and configuration."""
+    agent = DessertAgent.get_instance(provider="openai")
+
+    assert DessertAgent.get_instance(provider="openai") is agent
+    assert DessertAgent.get_instance(api_key="sk-other") is not agent
+    assert isinstance(AppetizerAgent.get_instance(provider="openai"), AppetizerAgent)
@@ -0,0 +1,24 @@
+from src.database.response_cache import ResponseCache
+
+
+def test_response_cache_round_trips_responses():
+    """Test that a stored response is returned for the same inputs in any order."""
+    cache = ResponseCache(path=":memory:")
+    cache.set({"raw_response": "Panettone"}, "dessert_agent", {"a": 1, "b": 2})
+
+    assert cache.get("dessert_agent", {"b": 2, "a": 1}) == {"raw_response": "Panettone"}
+    assert cache.get("appetizer_agent", {"a": 1, "b": 2}) is None
+
+
+def test_response_cache_treats_storage_failures_as_misses():
+    """Test that corrupt rows and unserializable values never raise."""
+    cache = ResponseCache(path=":memory:")
+    cache.set({"raw_response": "Panettone"}, "dessert_agent")
+    cache._conn.execute("UPDATE responses SET response = 'not json'")
+
+    circular: dict = {}
+    circular["self"] = circular
+    cache.set(circular, "appetizer_agent")
+
+    assert cache.get("dessert_agent") is None
+    assert cache.get("appetizer_agent") is None
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock, Mock
+
+from src.database.vector_store import RecipeVectorStore
+from src.models.recipe import Recipe
+
+
+def _recipe(recipe_id: str, name: str) -> Recipe:
+    return Recipe(
+        id=recipe_id,
+        name=name,
+        description="Christmas dish",
+        category="dessert",
+        servings=4,
+        difficulty="easy",
+    )
+
+
+def test_sync_recipes_only_embeds_changes():
+    """Test that only changed recipes are embedded and missing ones are removed."""
+    unchanged = _recipe("1", "Panettone")
+    changed = _recipe("2", "Pandoro")
+    store = RecipeVectorStore.__new__(RecipeVectorStore)
+    store.collection_name = "recipes"
+    store.embedding_name = "recipe_embedding"
+    store.embedder = Mock()
+    store.embedder.embed.return_value = [[0.1, 0.2]]
+    store.vectorstore = MagicMock()
+    store.vectorstore.dump_collection.return_value = [
+        Mock(id="1", metadata={"recipe_json": unchanged.model_dump_json()}),
+        Mock(id="2", metadata={"recipe_json": "{}"}),
+        Mock(id="3", metadata={"recipe_json": "{}"}),
+    ]
+
+    embedded = store.sync_recipes([unchanged, changed])
+
+    assert embedded == 1
+    store.embedder.embed.assert_called_once_with([changed.to_search_text()])
+    store.vectorstore.remove.assert_called_once_with(
+        collection_name="recipes", ids=["3"]
+    )
+
+
+def test_search_recipes_many_retries_without_a_rejected_filter():
+    """Test that a rejected filter falls back to an unfiltered search and skips bad rows."""
+    panettone = _recipe("1", "Panettone")
+    store = RecipeVectorStore.__new__(RecipeVectorStore)
+    store.collection_name = "recipes"
+    store.embedder = Mock()
+    store.embedder.embed.return_value = [[0.1, 0.2]]
+    store.vectorstore = MagicMock()
+    store.vectorstore.search.side_effect = [
+        ValueError("bad filter"),
+        [
+            Mock(metadata={"recipe_json": panettone.model_dump_json()}),
+            Mock(metadata={"recipe_json": "{}"}),
+        ],
+    ]
+
+    results = store.search_recipes_many([("sweet bread", None)], is_vegan=True)
+
+    assert [r.name for r in results[0]] == ["Panettone"]
+    assert "filter" not in store.vectorstore.search.call_args.kwargs